@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Time ArticleSplitter.split on a synthetic long article.
+
+The splitter is pure Python with no third-party imports, so this runs the
+same under CPython and PyPy:
+
+    python scripts/bench_splitter.py
+    pypy3 scripts/bench_splitter.py --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from tts_article.splitter import ArticleSplitter, _split_cached  # noqa: E402
+
+_PARAGRAPH = (
+    "[main]这是一个用于测试的长段落，其中包含逗号、句号。还有问号吗？当然有！"
+    "Mixed English text, with commas and spaces, follows the Chinese part. "
+    "一个没有任何标点的超长句子" * 3 + "\n"
+    "[vivian]第二个声音的文本。\n"
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--max-length", type=int, default=40)
+    args = parser.parse_args()
+
+    article = _PARAGRAPH * args.paragraphs
+    splitter = ArticleSplitter(max_length=args.max_length)
+    n = len(splitter.split(article))  # warm-up (lets PyPy's JIT trace the loops)
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        _split_cached.cache_clear()  # time the split itself, not the memoized result
+        t0 = time.perf_counter()
+        splitter.split(article)
+        best = min(best, time.perf_counter() - t0)
+
+    print(
+        f"{platform.python_implementation()} {platform.python_version()}: "
+        f"{len(article)} chars -> {n} segments, best of {args.repeat}: {best * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
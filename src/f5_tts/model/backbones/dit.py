@@ -26,6 +26,10 @@ from f5_tts.model.modules import (
 )
 
 
+# runs a function eagerly, outside torch.compile graphs (torch >= 2.1; a no-op before)
+_eager = getattr(getattr(torch, "compiler", None), "disable", lambda fn: fn)
+
+
 # Text embedding
 
 
@@ -209,6 +213,14 @@ class DiT(nn.Module):
 
         self.checkpoint_activations = checkpoint_activations
 
+        # TeaCache-style step caching at inference, off when 0: the block stack is
+        # skipped (its cached residual re-applied) while the accumulated relative
+        # L1 change of the first block's modulated input stays below the threshold.
+        # State is kept per input shape, since with CFG reuse (CFM.cfg_cache_interval)
+        # packed cond + uncond passes alternate with cond-only ones
+        self.step_cache_threshold = 0.0
+        self._step_cache = {}  # shape -> [previous modulated input, block-stack residual, accumulated change]
+
         self.initialize_weights()
 
     def initialize_weights(self):
@@ -274,6 +286,29 @@ class DiT(nn.Module):
 
     def clear_cache(self):
         self.text_cond, self.text_uncond = None, None
+        self._step_cache = {}
+
+    # step cache bookkeeping mutates module state and branches on a measured value,
+    # so it stays out of compiled graphs
+    @_eager
+    def reusable_residual(self, x, t):
+        # the block-stack residual this denoising step may reuse, or None to run the stack;
+        # the data-dependent decision costs one host sync per step
+        state = self._step_cache.setdefault(tuple(x.shape), [None, None, 0.0])
+        modulated = self.transformer_blocks[0].attn_norm(x, emb=t)[0]
+        prev, residual = state[0], state[1]
+        state[0] = modulated
+        if prev is None or residual is None:
+            return None
+        state[2] += ((modulated - prev).abs().mean() / prev.abs().mean()).item()
+        if state[2] < self.step_cache_threshold:
+            return residual
+        state[2] = 0.0
+        return None
+
+    @_eager
+    def store_residual(self, x, residual):
+        self._step_cache[tuple(x.shape)][1] = residual
 
     def forward(
         self,
@@ -313,12 +348,22 @@ class DiT(nn.Module):
         if self.long_skip_connection is not None:
             residual = x
 
-        for block in self.transformer_blocks:
-            if self.checkpoint_activations:
-                # https://pytorch.org/docs/stable/checkpoint.html#torch.utils.checkpoint.checkpoint
-                x = torch.utils.checkpoint.checkpoint(self.ckpt_wrapper(block), x, t, mask, rope, use_reentrant=False)
-            else:
-                x = block(x, t, mask=mask, rope=rope)
+        step_cache = self.step_cache_threshold > 0 and not self.training
+        cached_residual = self.reusable_residual(x, t) if step_cache else None
+        if cached_residual is not None:
+            x = x + cached_residual
+        else:
+            blocks_in = x
+            for block in self.transformer_blocks:
+                if self.checkpoint_activations:
+                    # https://pytorch.org/docs/stable/checkpoint.html#torch.utils.checkpoint.checkpoint
+                    x = torch.utils.checkpoint.checkpoint(
+                        self.ckpt_wrapper(block), x, t, mask, rope, use_reentrant=False
+                    )
+                else:
+                    x = block(x, t, mask=mask, rope=rope)
+            if step_cache:
+                self.store_residual(blocks_in, x - blocks_in)
 
         if self.long_skip_connection is not None:
             x = self.long_skip_connection(torch.cat((x, residual), dim=-1))
@@ -72,6 +72,10 @@ class CFM(nn.Module):
 
         # sampling related
         self.odeint_kwargs = odeint_kwargs
+        # cfg branch reuse at inference, off when 0: the unconditional branch is only
+        # recomputed every cfg_cache_interval steps (and on the first two); in between
+        # it is estimated as the conditional output plus the last measured uncond - cond gap
+        self.cfg_cache_interval = 0
 
         # vocab map for tokenization
         self.vocab_char_map = vocab_char_map
@@ -159,6 +163,8 @@ class CFM(nn.Module):
 
         # neural ode
 
+        cfg_state = {"step": 0, "gap": None}  # for cfg branch reuse, see cfg_cache_interval
+
         def fn(t, x):
             # at each step, conditioning is fixed
             # step_cond = torch.where(cond_mask, cond, torch.zeros_like(cond))
@@ -177,6 +183,22 @@ class CFM(nn.Module):
                 )
                 return pred
 
+            step, interval = cfg_state["step"], self.cfg_cache_interval
+            cfg_state["step"] += 1
+            if interval and cfg_state["gap"] is not None and step >= 2 and step % interval:
+                # conditional branch only, unconditional one estimated from the cached gap
+                pred = self.transformer(
+                    x=x,
+                    cond=step_cond,
+                    text=text,
+                    time=t,
+                    mask=mask,
+                    drop_audio_cond=False,
+                    drop_text=False,
+                    cache=True,
+                )
+                return pred - cfg_state["gap"] * cfg_strength
+
             # predict flow (cond and uncond), for classifier-free guidance
             pred_cfg = self.transformer(
                 x=x,
@@ -188,6 +210,8 @@ class CFM(nn.Module):
                 cache=True,
             )
             pred, null_pred = torch.chunk(pred_cfg, 2, dim=0)
+            if interval:
+                cfg_state["gap"] = null_pred - pred
             return pred + (pred - null_pred) * cfg_strength
 
         # noise input
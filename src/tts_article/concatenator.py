@@ -1,12 +1,58 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import Callable, List
 from pydub import AudioSegment
 import os
+import shutil
 
 from .subtitle_generator import SubtitleEntry
 
 
+def _is_wav(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() == ".wav"
+
+
+def _read_pcm(path: str, channels: int):
+    """Decode path to float32 frames with the given channel count (mono is duplicated, anything else averaged)."""
+    import soundfile as sf
+
+    data, _ = sf.read(path, dtype="float32", always_2d=True)
+    if data.shape[1] == channels:
+        return data
+    if data.shape[1] == 1:
+        return data.repeat(channels, axis=1)
+    mono = data.mean(axis=1, keepdims=True)
+    return mono if channels == 1 else mono.repeat(channels, axis=1)
+
+
+@lru_cache(None)
+def _av():
+    """PyAV if installed, else None; decodes and resamples in-process instead of spawning ffmpeg."""
+    try:
+        import av
+    except ImportError:
+        return None
+    return av
+
+
+def _decode_av(path: str, samplerate: int, channels: int):
+    """Decode any container/codec PyAV reads to float32 frames at samplerate with channels (1 or 2)."""
+    import numpy as np
+
+    av = _av()
+    resampler = av.AudioResampler(format="flt", layout="mono" if channels == 1 else "stereo", rate=samplerate)
+    chunks = []
+    with av.open(path) as container:
+        for frame in container.decode(container.streams.audio[0]):
+            chunks.extend(f.to_ndarray() for f in resampler.resample(frame))
+        chunks.extend(f.to_ndarray() for f in resampler.resample(None))
+    if not chunks:
+        return np.zeros((0, channels), dtype=np.float32)
+    # Packed float output is one interleaved row per frame
+    return np.concatenate(chunks, axis=1).reshape(-1, channels)
+
+
 class FileConcatenator:
     def __init__(self):
         pass
@@ -19,6 +65,38 @@ class FileConcatenator:
     ) -> str:
         if not audio_paths:
             raise ValueError("No audio paths provided for concatenation")
+        if len(audio_paths) == 1 and _is_wav(audio_paths[0]) and _is_wav(output_path):
+            # Nothing to join: copy the bytes (copyfile uses sendfile on Linux)
+            try:
+                shutil.copyfile(audio_paths[0], output_path)
+            except shutil.SameFileError:
+                pass
+            return output_path
+        import soundfile as sf
+
+        infos = []
+        for p in audio_paths:
+            try:
+                infos.append(sf.info(p))
+            except RuntimeError:
+                infos.append(None)  # not readable by libsndfile
+        first = infos[0]
+        if first is not None:
+            # Mono files are upmixed rather than stereo ones downmixed
+            sr, channels = first.samplerate, max(i.channels for i in infos if i is not None)
+            # libsndfile reads files at the output rate; PyAV, when installed,
+            # decodes and resamples the rest in-process
+            readers = [
+                (lambda p=p: _read_pcm(p, channels))
+                if i is not None and i.samplerate == sr
+                else (lambda p=p: _decode_av(p, sr, channels))
+                for p, i in zip(audio_paths, infos)
+            ]
+            if all(i is not None and i.samplerate == sr for i in infos) or (_av() is not None and channels <= 2):
+                self._concatenate_pcm(readers, first, channels, output_path, cross_fade_duration)
+                return output_path
+
+        # Without PyAV, mixed sample rates and other formats go through pydub (ffmpeg)
         combined: AudioSegment = AudioSegment.from_file(audio_paths[0])
         for p in audio_paths[1:]:
             next_seg = AudioSegment.from_file(p)
@@ -27,10 +105,49 @@ class FileConcatenator:
         combined.export(output_path, format="wav")
         return output_path
 
-    def concatenate_subtitles(
-        self, entries: List[SubtitleEntry], output_path: str
-    ) -> str:
+    @staticmethod
+    def _concatenate_pcm(
+        readers: List[Callable], info, channels: int, output_path: str, cross_fade_duration: float
+    ) -> None:
+        """Stream decoded files into the output with linear crossfades.
+
+        readers return each file's float32 frames at the output rate (taken
+        from info, the first file's sf.info) and channel count. Each file
+        is decoded once and written out as soon as it is read; only the
+        frames that may overlap the next file are held back to be blended.
+        Peak memory is one input file, not the whole output. The output
+        keeps the first file's subtype.
+        """
+        import numpy as np
+        import soundfile as sf
+
+        sr = info.samplerate
+        xfade = int(cross_fade_duration * sr)
+        subtype = info.subtype if sf.check_format("WAV", info.subtype) else None
+        ramps = {}
+        tail = None  # end of the previous file, still to be crossfaded into the next
+        with sf.SoundFile(output_path, "w", samplerate=sr, channels=channels, subtype=subtype, format="WAV") as out:
+            for k, read in enumerate(readers):
+                data = read()
+                # The crossfade fits in this file and in what the previous one held back
+                x = min(len(tail), len(data)) if tail is not None else 0
+                if tail is not None:
+                    out.write(tail[: len(tail) - x])
+                if x:
+                    ramp = ramps.get(x)
+                    if ramp is None:
+                        ramp = ramps[x] = np.linspace(0.0, 1.0, x, dtype=np.float32)[:, None]
+                    blend = tail[len(tail) - x :]
+                    blend *= 1.0 - ramp
+                    blend += data[:x] * ramp
+                    out.write(blend)
+                hold = min(xfade, len(data) - x) if k + 1 < len(readers) else 0
+                out.write(data[x : len(data) - hold])
+                tail = data[len(data) - hold :]
+
+    def concatenate_subtitles(self, entries: List[SubtitleEntry], output_path: str) -> str:
         # For compatibility, delegate to generating an SRT from entries
         from .subtitle_generator import SubtitleGenerator
+
         sg = SubtitleGenerator()
         return sg.generate_srt(entries, output_path)
@@ -1,13 +1,206 @@
 from __future__ import annotations
 
 import os
+import copy
+import stat
+import sys
 import json
+import math
 import hashlib
-from typing import Dict, Optional
-from dataclasses import dataclass, asdict
+import importlib
+from typing import Dict, Iterator, Optional, Tuple
+from dataclasses import dataclass, asdict, field
+from functools import lru_cache
 
 
-@dataclass
+# TOML parsers in preference order: the Rust-backed rtoml when installed, then
+# stdlib tomllib (Python 3.11+), then the pure-Python tomli. Resolved on the
+# first TOML load, so importing this module never pays for a parser import.
+_TOML_BACKENDS = ("rtoml", "tomllib", "tomli")
+_toml = None
+
+
+def _toml_loads(content: str) -> dict:
+    global _toml
+    if _toml is None:
+        for name in _TOML_BACKENDS:
+            try:
+                _toml = importlib.import_module(name)
+                break
+            except ImportError:
+                continue
+        else:
+            raise ImportError("No TOML parser available; install tomli on Python < 3.11")
+    return _toml.loads(content)
+
+
+# Top-level keys load_config requires (checked in this order) and the defaults
+# for the optional scalars, applied in one pass when building a Config.
+_REQUIRED_FIELDS = ("input_article", "output_dir")
+_FIELD_DEFAULTS = (
+    ("max_sentence_length", 200),
+    ("model_name", "F5-TTS"),
+    ("nfe_step", 32),
+    ("cfg_strength", 2.0),
+    ("speed", 1.0),
+    ("target_rms", 0.1),
+    ("batch_size", 4),
+    ("precision", "auto"),
+    ("quantization", "none"),
+    ("compile", False),
+    ("force_regenerate", False),
+    ("cache_threshold", 0.0),
+    ("cfg_cache", False),
+)
+
+_PRECISIONS = ("auto", "fp32", "fp16", "bf16")
+_QUANTIZATIONS = ("none", "int8")
+
+# Numeric bounds as (name, lower, lower allowed, upper or None, below message,
+# above message); validate_config walks _NUMERIC_RULES in order.
+_SPEED_RULE = ("speed", 0, False, 3.0, "speed must be positive", "speed is too high")
+_NUMERIC_RULES = (
+    ("max_sentence_length", 0, False, 1000, "max_sentence_length must be positive", "max_sentence_length is too large"),
+    ("nfe_step", 0, False, None, "nfe_step must be positive", None),
+    ("cfg_strength", 0, True, None, "cfg_strength must be non-negative", None),
+    ("batch_size", 0, False, None, "batch_size must be positive", None),
+    ("cache_threshold", 0, True, None, "cache_threshold must be non-negative", None),
+    _SPEED_RULE,
+)
+
+
+def _range_error(value, name, lo, lo_ok, hi, lo_msg, hi_msg) -> Optional[str]:
+    """Return the message for *value* breaking one numeric rule, else None.
+
+    NaN and infinities are rejected too; plain comparisons let NaN through.
+    """
+    if not math.isfinite(value):
+        return f"{name} must be a finite number"
+    if value < lo or (value == lo and not lo_ok):
+        return lo_msg
+    if hi is not None and value > hi:
+        return hi_msg
+    return None
+
+
+# Parsed configs keyed by (absolute path, mtime_ns, size): an edited file gets a new key.
+# Companion ref .txt and polyphone JSON files are read at parse time and are not
+# part of the key; call ConfigManager.clear_cache() after changing only those.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], "Config"] = {}
+
+
+@lru_cache(maxsize=256)
+def _classify_path(path: str) -> str:
+    """Classify *path* as "empty", "missing", "dir", "file" or "other" with one stat.
+
+    Memoized so the fast and slow validation passes, and voices sharing a
+    reference clip, stat each path once; validate_config clears it on entry.
+    """
+    if not path:
+        return "empty"
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return "missing"
+    if stat.S_ISREG(mode):
+        return "file"
+    return "dir" if stat.S_ISDIR(mode) else "other"
+
+
+def _build_voice(key: str, v: object) -> "VoiceConfig":
+    """Build one VoiceConfig from its raw ``[voices.<key>]`` table."""
+    # Voice names key every per-segment lookup downstream; interned
+    # keys let those dict probes match on identity.
+    key = sys.intern(key)
+    if not isinstance(v, dict):
+        raise ValueError(f"Invalid voice configuration for '{key}'")
+    if "ref_audio" not in v:
+        raise ValueError(f"Missing 'ref_audio' for voice '{key}'")
+    ref_audio = v.get("ref_audio", "")
+    ref_text = v.get("ref_text", "")
+    # Auto-fill ref_text from a companion .txt file next to the audio if not provided
+    if not ref_text and ref_audio:
+        txt_path = os.path.splitext(ref_audio)[0] + ".txt"
+        if os.path.exists(txt_path):
+            try:
+                with open(txt_path, "r", encoding="utf-8") as tf:
+                    ref_text = tf.read().strip() or ref_text
+            except Exception:
+                pass
+    return VoiceConfig(
+        name=key,
+        ref_audio=ref_audio,
+        ref_text=ref_text,
+        speed=v.get("speed", None),
+        nfe_step=v.get("nfe_step", None),
+        cfg_strength=v.get("cfg_strength", None),
+        target_rms=v.get("target_rms", None),
+    )
+
+
+def _validation_key(config: "Config") -> tuple:
+    """Snapshot of every field validate_config reads."""
+    return (
+        config.input_article,
+        config.output_dir,
+        config.max_sentence_length,
+        config.nfe_step,
+        config.cfg_strength,
+        config.batch_size,
+        config.cache_threshold,
+        config.precision,
+        config.quantization,
+        config.speed,
+        tuple((name, v.ref_audio, v.speed) for name, v in (config.voices or {}).items()),
+    )
+
+
+def _config_is_valid(config: "Config") -> bool:
+    """Return True when validate_config would report no errors."""
+    if not (config.output_dir and config.voices and config.precision in _PRECISIONS):
+        return False
+    if config.quantization not in _QUANTIZATIONS:
+        return False
+    for name, *rule in _NUMERIC_RULES:
+        if _range_error(getattr(config, name), name, *rule) is not None:
+            return False
+    for name, v in config.voices.items():
+        if not name or v.ref_audio[-4:].lower() != ".wav":
+            return False
+        if v.speed is not None and _range_error(v.speed, *_SPEED_RULE) is not None:
+            return False
+    # Stat last: every path must resolve, so batch the syscalls after the cheap checks
+    if _classify_path(config.input_article) != "file":
+        return False
+    return all(_classify_path(v.ref_audio) not in ("empty", "missing", "dir") for v in config.voices.values())
+
+
+def _voice_errors(name: str, v: "VoiceConfig") -> Iterator[str]:
+    """Yield validation errors for one configured voice."""
+    if not name:
+        yield "Voice name cannot be empty"
+    kind = _classify_path(v.ref_audio)
+    if kind == "empty":
+        yield "ref_audio path is empty"
+        return
+    if kind == "missing":
+        yield f"Reference audio file not found: {v.ref_audio}"
+        return
+    if kind == "dir":
+        yield "Reference audio path is not a file"
+        return
+    # Only the last four characters matter; lowercasing them avoids a
+    # splitext tuple and a full-path lower() per voice.
+    if v.ref_audio[-4:].lower() != ".wav":
+        yield "Reference audio must be a WAV file"
+    # voice speed
+    if v.speed is not None:
+        msg = _range_error(v.speed, *_SPEED_RULE)
+        if msg is not None:
+            yield msg
+
+
+@dataclass(slots=True)
 class VoiceConfig:
     name: str
     ref_audio: str
@@ -18,7 +211,7 @@ class VoiceConfig:
     target_rms: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     input_article: str
     output_dir: str
@@ -28,10 +221,27 @@ class Config:
     cfg_strength: float = 2.0
     speed: float = 1.0
     target_rms: float = 0.1
+    # Number of same-voice segments generated together in one forward pass
+    batch_size: int = 4
+    # Model weight precision: "auto" (F5-TTS default), "fp32", "fp16" or "bf16"
+    precision: str = "auto"
+    # DiT weight quantization: "none" or "int8" (dynamic int8 Linear layers, CPU only)
+    quantization: str = "none"
+    # Opt-in: compile the DiT and vocoder with torch.compile at model load (skipped on MPS)
+    compile: bool = False
+    # Regenerate every segment even when its cached audio is complete
+    force_regenerate: bool = False
+    # DiT step caching (TeaCache): skip denoising steps whose input barely changed; 0 disables
+    cache_threshold: float = 0.0
+    # Recompute the unconditional CFG branch only every few steps, reusing its gap in between
+    cfg_cache: bool = False
     voices: Optional[Dict[str, VoiceConfig]] = None
     # Global polyphone overrides (applies to all voices)
     polyphone_dict: Optional[Dict[str, str]] = None
 
+    # (settings key, errors) from the last ConfigManager.validate_config call
+    _validated: Optional[Tuple[tuple, Tuple[str, ...]]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.voices is None:
             self.voices = {}
@@ -42,68 +252,52 @@ class ConfigManager:
     def load_config(config_path: str) -> Config:
         # Load file contents; provide a clearer error if missing
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            st = os.stat(config_path)
+            # Absolute, so one relative path loaded from two directories can't collide
+            cache_key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                # Callers mutate the result (CLI overrides), so hand out a copy
+                return copy.deepcopy(cached)
+            # One bytes read and one strict UTF-8 decode; text mode would add
+            # an incremental decoder and newline translation on top.
+            with open(config_path, "rb") as f:
+                content = f.read().decode("utf-8")
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        try:
-            data = json.loads(content)
-        except Exception:
-            # Try stdlib tomllib (Python 3.11+), then tomli third-party
-            toml_data = None
-            parse_err = None
+        cfg = ConfigManager.loads(content)
+        # The caller owns the freshly parsed Config; the cache keeps its own snapshot
+        _CONFIG_CACHE[cache_key] = copy.deepcopy(cfg)
+        return cfg
+
+    @staticmethod
+    def loads(content: str) -> Config:
+        """Build a Config from JSON or TOML text without reading a config file."""
+        data = None
+        # Only a JSON object can be a config; skip the JSON attempt for TOML text
+        if content.lstrip()[:1] == "{":
             try:
-                import tomllib as _tomllib  # type: ignore
-                toml_data = _tomllib.loads(content)
-            except Exception as e:  # pragma: no cover - depends on runtime
-                parse_err = e
-                try:
-                    import importlib
-                    tomli = importlib.import_module("tomli")
-                    toml_data = tomli.loads(content)
-                except Exception as e2:
-                    parse_err = e2
-                    toml_data = None
-            if toml_data is None:
-                raise ValueError(f"Failed to parse TOML file: {parse_err}")
-            data = toml_data
+                data = json.loads(content)
+            except Exception:
+                pass
+        if data is None:
+            try:
+                data = _toml_loads(content)
+            except Exception as e:
+                raise ValueError(f"Failed to parse TOML file: {e}")
         # Validate required top-level fields
-        if "input_article" not in data:
-            raise ValueError("Missing required field: input_article")
-        if "output_dir" not in data:
-            raise ValueError("Missing required field: output_dir")
+        missing = next((k for k in _REQUIRED_FIELDS if k not in data), None)
+        if missing is not None:
+            raise ValueError(f"Missing required field: {missing}")
 
         voices_data = data.get("voices")
         if not isinstance(voices_data, dict):
             raise ValueError("At least one voice must be configured")
-        voices: Dict[str, VoiceConfig] = {}
-        for key, v in voices_data.items():
-            if not isinstance(v, dict):
-                raise ValueError(f"Invalid voice configuration for '{key}'")
-            if "ref_audio" not in v:
-                raise ValueError(f"Missing 'ref_audio' for voice '{key}'")
-            voice = VoiceConfig(
-                name=key,
-                ref_audio=v.get("ref_audio", ""),
-                ref_text=v.get("ref_text", ""),
-                speed=v.get("speed", None),
-                nfe_step=v.get("nfe_step", None),
-                cfg_strength=v.get("cfg_strength", None),
-                target_rms=v.get("target_rms", None),
-            )
-            # Auto-fill ref_text from a companion .txt file next to the audio if not provided
-            if not voice.ref_text and voice.ref_audio:
-                base = os.path.splitext(voice.ref_audio)[0]
-                txt_path = base + ".txt"
-                if os.path.exists(txt_path):
-                    try:
-                        with open(txt_path, "r", encoding="utf-8") as tf:
-                            content = tf.read().strip()
-                            if content:
-                                voice.ref_text = content
-                    except Exception:
-                        pass
-            voices[key] = voice
+        # Built in one comprehension; _build_voice interns each name, which
+        # becomes the key.
+        voices: Dict[str, VoiceConfig] = {
+            voice.name: voice for voice in (_build_voice(key, v) for key, v in voices_data.items())
+        }
         # Load global polyphone_dict (supports inline dict or path to JSON file)
         polyphone_data = data.get("polyphone_dict")
         if isinstance(polyphone_data, str):
@@ -119,38 +313,26 @@ class ConfigManager:
             polyphone_dict = polyphone_data
         else:
             polyphone_dict = None
+        fields = {k: data.get(k, default) for k, default in _FIELD_DEFAULTS}
+        if isinstance(fields["model_name"], str):
+            fields["model_name"] = sys.intern(fields["model_name"])
         cfg = Config(
-            input_article=data.get("input_article", "speech.txt"),
-            output_dir=data.get("output_dir", "output"),
-            max_sentence_length=data.get("max_sentence_length", 200),
-            model_name=data.get("model_name", "F5-TTS"),
-            nfe_step=data.get("nfe_step", 32),
-            cfg_strength=data.get("cfg_strength", 2.0),
-            speed=data.get("speed", 1.0),
-            target_rms=data.get("target_rms", 0.1),
+            input_article=data["input_article"],
+            output_dir=data["output_dir"],
             voices=voices,
             polyphone_dict=polyphone_dict,
+            **fields,
         )
         return cfg
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget every parsed config, forcing the next load_config to re-read."""
+        _CONFIG_CACHE.clear()
+
     @staticmethod
     def get_default_config() -> Config:
-        voices = {
-            "main": VoiceConfig(name="main", ref_audio="voices/main.wav", ref_text="", speed=None),
-        }
-        # Auto-fill default ref_text from accompanying txt if present
-        if voices:
-            for key, voice in list(voices.items()):
-                if not voice.ref_text and voice.ref_audio:
-                    txt_path = os.path.splitext(voice.ref_audio)[0] + ".txt"
-                    if os.path.exists(txt_path):
-                        try:
-                            with open(txt_path, "r", encoding="utf-8") as tf:
-                                content = tf.read().strip()
-                                if content:
-                                    voice.ref_text = content
-                        except Exception:
-                            pass
+        voices = {"main": _build_voice("main", {"ref_audio": "voices/main.wav"})}
         return Config(
             input_article="speech.txt",
             output_dir="output",
@@ -163,63 +345,60 @@ class ConfigManager:
         )
 
     @staticmethod
-    def validate_config(config: Config) -> list[str]:
+    def validate_config(config: Config, refresh: bool = False) -> list[str]:
+        """Return validation errors for *config* (empty when valid).
+
+        The result is remembered on the Config together with the settings it
+        was computed from, so re-validating an unchanged config skips the
+        path stats. Any change to a checked field (including a voice's
+        ref_audio or speed) recomputes; ``refresh=True`` forces a recheck
+        after files on disk have changed.
+        """
+        key = _validation_key(config)
+        cached = config._validated
+        if not refresh and cached is not None and cached[0] == key:
+            return list(cached[1])
+        errors = ConfigManager._collect_errors(config)
+        config._validated = (key, tuple(errors))
+        return errors
+
+    @staticmethod
+    def _collect_errors(config: Config) -> list[str]:
+        # Path kinds are only trusted within one pass; files may appear later.
+        _classify_path.cache_clear()
+        # Fast path: a valid config (the usual case) returns before any
+        # message is formatted; only failures walk the rules below.
+        if _config_is_valid(config):
+            return []
         errors: list[str] = []
         # input_article checks
-        if not config.input_article:
+        kind = _classify_path(config.input_article)
+        if kind == "empty":
             errors.append("input_article path is empty")
-        else:
-            if not os.path.exists(config.input_article):
-                errors.append(f"Input article file not found: {config.input_article}")
-            elif not os.path.isfile(config.input_article):
-                errors.append("Input article path is not a file")
+        elif kind == "missing":
+            errors.append(f"Input article file not found: {config.input_article}")
+        elif kind != "file":
+            errors.append("Input article path is not a file")
 
         # output_dir
         if not config.output_dir:
             errors.append("output_dir path is empty")
 
         # numeric validations
-        if config.max_sentence_length <= 0:
-            errors.append("max_sentence_length must be positive")
-        elif config.max_sentence_length > 1000:
-            errors.append("max_sentence_length is too large")
+        for name, *rule in _NUMERIC_RULES:
+            msg = _range_error(getattr(config, name), name, *rule)
+            if msg is not None:
+                errors.append(msg)
 
-        if config.nfe_step <= 0:
-            errors.append("nfe_step must be positive")
-
-        if config.cfg_strength < 0:
-            errors.append("cfg_strength must be non-negative")
-
-        if config.speed <= 0:
-            errors.append("speed must be positive")
-        elif config.speed > 3.0:
-            errors.append("speed is too high")
+        if config.precision not in _PRECISIONS:
+            errors.append("precision must be one of: auto, fp32, fp16, bf16")
+        if config.quantization not in _QUANTIZATIONS:
+            errors.append("quantization must be one of: none, int8")
 
         # voices
         if not config.voices:
             errors.append("At least one voice must be configured")
             return errors
 
-        for name, v in config.voices.items():
-            if not name:
-                errors.append("Voice name cannot be empty")
-            if not v.ref_audio:
-                errors.append("ref_audio path is empty")
-                continue
-            if not os.path.exists(v.ref_audio):
-                errors.append(f"Reference audio file not found: {v.ref_audio}")
-                continue
-            if os.path.isdir(v.ref_audio):
-                errors.append("Reference audio path is not a file")
-                continue
-            _, ext = os.path.splitext(v.ref_audio)
-            if ext.lower() != ".wav":
-                errors.append("Reference audio must be a WAV file")
-            # voice speed
-            if v.speed is not None:
-                if v.speed <= 0:
-                    errors.append("speed must be positive")
-                elif v.speed > 3.0:
-                    errors.append("speed is too high")
-
+        errors.extend(e for name, v in config.voices.items() for e in _voice_errors(name, v))
         return errors
@@ -2,9 +2,20 @@ from __future__ import annotations
 
 import os
 import argparse
+import dataclasses
+import functools
+import inspect
+import logging
 from pathlib import Path
-from typing import Tuple
-from pydub import AudioSegment
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from .config import VoiceConfig as VoiceConfig, Config as TTSConfig
+from .server import DAEMON_SOCK_ENV
+from .utils import wav_duration
+
+if TYPE_CHECKING:
+    import numpy as np
+    import torch
 
 # Delay importing the heavy / native-backed F5-TTS package until we have
 # validated environment variables (notably PYTHONHASHSEED). Importing it at
@@ -12,16 +23,63 @@ from pydub import AudioSegment
 # PYTHONHASHSEED is invalid. We'll import inside initialize_model().
 F5TTS = None
 
-from .config import VoiceConfig as VoiceConfig, Config as TTSConfig
+log = logging.getLogger("tts_article")
+
+# With cfg_cache, the unconditional CFG branch is recomputed every this many denoising steps
+_CFG_CACHE_INTERVAL = 3
+
+
+# Path arguments of daemon-routed methods; the daemon keeps the cwd it was started from
+_DAEMON_PATH_PARAMS = ("ref_file", "ref_audio", "output_path")
+
+
+def _daemon_routed(method):
+    """Run the method on the model daemon instead when TTS_DAEMON_SOCK is set (see server.py).
+
+    Relative paths (including voice_config.ref_audio) are made absolute here,
+    since the daemon would resolve them against its own working directory.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._daemon:
+            from .server import call
+            bound = signature.bind(self, *args, **kwargs)
+            for name in _DAEMON_PATH_PARAMS:
+                if isinstance(bound.arguments.get(name), str):
+                    bound.arguments[name] = os.path.abspath(bound.arguments[name])
+            voice_config = bound.arguments.get("voice_config")
+            if voice_config is not None:
+                bound.arguments["voice_config"] = dataclasses.replace(
+                    voice_config, ref_audio=os.path.abspath(voice_config.ref_audio)
+                )
+            return call(self._daemon, method.__name__, bound.args[1:], bound.kwargs)
+        return method(self, *args, **kwargs)
+    return wrapper
 
 
 class AudioGenerator:
-    def __init__(self, config: TTSConfig):
+    def __init__(self, config: TTSConfig, device: str | None = None):
         self.config = config
+        # Torch device for the model ("cuda:1", ...); None lets F5-TTS pick
+        self.device = device
         self._tts = None
+        # (ref_file, mtime_ns, ref_text) -> (audio, sample_rate, final_ref_text) of the preprocessed reference;
+        # the mtime makes an edited clip miss (the daemon keeps these across runs)
+        self._ref_cache: Dict[Tuple[str, int, str], Tuple["torch.Tensor", int, str]] = {}
+        # (ref_file, mtime_ns, ref_text, target_rms) -> reference conditioning for infer_batch, see _batch_ref
+        self._batch_ref_cache: Dict[Tuple[str, int, str, float], tuple] = {}
+        # Socket of a running model daemon; when set, the model is never loaded here
+        self._daemon = os.environ.get(DAEMON_SOCK_ENV) or None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the model is loaded in this process or served by the daemon."""
+        return self._tts is not None or self._daemon is not None
 
     def initialize_model(self):
-        if self._tts is None:
+        if self._tts is None and self._daemon is None:
             try:
                 # Ensure PYTHONHASHSEED is valid; some environments set an invalid
                 # value which causes a fatal error inside extension modules when
@@ -39,7 +97,7 @@ class AudioGenerator:
                     except Exception:
                         return False
                 if not _valid_phs(phs):
-                    print(f"⚠️  Invalid PYTHONHASHSEED='{phs}', setting to 'random' to avoid runtime crash.")
+                    log.warning("⚠️  Invalid PYTHONHASHSEED='%s', setting to 'random' to avoid runtime crash.", phs)
                     os.environ["PYTHONHASHSEED"] = "random"
 
                 # Import the F5-TTS binding now that we've ensured the
@@ -47,23 +105,124 @@ class AudioGenerator:
                 try:
                     from f5_tts.api import F5TTS as _F5TTS  # type: ignore
                 except Exception:
-                    print("⚠️  F5-TTS is not installed or failed to import in this environment.")
+                    log.warning("⚠️  F5-TTS is not installed or failed to import in this environment.")
                     self._tts = None
                     return
 
-                print("🔄 Loading F5-TTS model...")
-                self._tts = _F5TTS(model=self.config.model_name)
-                print("✅ Model loaded!\n")
+                log.info("🔄 Loading F5-TTS model...")
+                if self.device is None:
+                    self._tts = _F5TTS(model=self.config.model_name)
+                else:
+                    self._tts = _F5TTS(model=self.config.model_name, device=self.device)
+                self._apply_precision()
+                self._apply_quantization()
+                self._apply_step_cache()
+                self._compile_model()
+                log.info("✅ Model loaded!")
             except Exception as e:
-                import traceback
-                print(f"⚠️  Could not load F5-TTS model: {e}")
-                traceback.print_exc()
+                log.warning("⚠️  Could not load F5-TTS model: %s", e, exc_info=True)
                 self._tts = None
 
+    def _apply_precision(self):
+        """Cast the DiT/CFM weights to the configured precision.
+
+        "auto" keeps F5-TTS's own choice (fp16 on CUDA sm>=7, fp32 elsewhere).
+        The vocoder stays fp32: F5-TTS casts the generated mel to fp32 before decoding.
+        """
+        precision = getattr(self.config, "precision", "auto")
+        if precision == "auto":
+            return
+        import torch
+
+        dtype = {"fp32": torch.float32, "fp16": torch.float16, "bf16": torch.bfloat16}[precision]
+        self._tts.ema_model = self._tts.ema_model.to(dtype)
+
+    def _apply_quantization(self):
+        """Swap the DiT's Linear layers for dynamic int8 ones when quantization = "int8".
+
+        Weights are stored as int8 and activations quantized on the fly, which
+        quarters the weight bytes the CPU streams per step. PyTorch's dynamic
+        quantization only runs on CPU and from fp32 weights; elsewhere the
+        setting is ignored with a warning.
+        """
+        if getattr(self.config, "quantization", "none") != "int8":
+            return
+        import torch
+
+        model = self._tts.ema_model
+        if str(self._tts.device) != "cpu" or next(model.parameters()).dtype != torch.float32:
+            log.warning("⚠️  int8 quantization needs the fp32 model on CPU, not quantizing on %s", self._tts.device)
+            return
+        model.transformer = torch.ao.quantization.quantize_dynamic(
+            model.transformer, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    def _apply_step_cache(self):
+        """Enable the DiT's TeaCache-style step caching when cache_threshold > 0,
+        and CFG branch reuse when cfg_cache is set.
+
+        Larger thresholds skip more of the nfe_step transformer passes; around
+        0.05-0.1 skips a quarter to a half of them with little audible change.
+        CFG reuse runs the unconditional branch on the first two steps and every
+        _CFG_CACHE_INTERVAL-th step only, roughly a third less DiT work.
+        """
+        threshold = getattr(self.config, "cache_threshold", 0.0)
+        if threshold > 0:
+            self._tts.ema_model.transformer.step_cache_threshold = threshold
+        if getattr(self.config, "cfg_cache", False):
+            self._tts.ema_model.cfg_cache_interval = _CFG_CACHE_INTERVAL
+
+    def _compile_model(self):
+        """Wrap the DiT and the vocoder in torch.compile and warm them up once so the
+        first segment doesn't pay for it.
+
+        The transformer is compiled rather than the CFM wrapper, since sampling calls
+        it nfe_step times per segment; for Vocos it is decode(), the entry point
+        generation uses. Sequence lengths differ per segment, hence dynamic shapes.
+        Each falls back to its eager version if compilation fails.
+        """
+        if not getattr(self.config, "compile", False):
+            return
+        import torch
+
+        if not hasattr(torch, "compile") or str(self._tts.device).startswith("mps"):
+            return
+
+        model = self._tts.ema_model
+        eager = model.transformer
+        model.transformer = torch.compile(eager, dynamic=True)
+        try:
+            log.info("🔧 Compiling DiT (one-time warm-up)...")
+            dtype = next(model.parameters()).dtype
+            cond = torch.zeros(1, 64, model.num_channels, device=self._tts.device, dtype=dtype)
+            with torch.inference_mode():
+                model.sample(cond=cond, text=["warm up"], duration=128, steps=2, cfg_strength=2.0)
+        except Exception as e:
+            log.warning("⚠️  torch.compile warm-up failed, using the eager model: %s", e)
+            model.transformer = eager
+
+        vocoder = self._tts.vocoder
+        vocos = self._tts.mel_spec_type == "vocos"
+        eager_vocoder = vocoder.decode if vocos else vocoder
+        compiled = torch.compile(eager_vocoder, dynamic=True)
+        try:
+            log.info("🔧 Compiling vocoder (one-time warm-up)...")
+            mel = torch.zeros(1, model.num_channels, 256, device=self._tts.device)
+            with torch.inference_mode():
+                compiled(mel)
+        except Exception as e:
+            log.warning("⚠️  torch.compile vocoder warm-up failed, using the eager vocoder: %s", e)
+            return
+        if vocos:
+            vocoder.decode = compiled
+        else:
+            self._tts.vocoder = compiled
+
     def _ensure_model(self):
         if self._tts is None:
             self.initialize_model()
 
+    @_daemon_routed
     def generate(self, segment, voice_config: VoiceConfig, output_path: str) -> Tuple[str, float]:
         """Generate audio for a single sentence segment.
         Returns (output_path, duration_seconds).
@@ -77,13 +236,13 @@ class AudioGenerator:
         # debugging. Do NOT silently fall back when ref_audio is missing or on
         # general generation errors — surface the error so caller can handle it.
         if self._tts is None:
+            import numpy as np
+            import soundfile as sf
+
             duration = 0.5
-            try:
-                from pydub.generators import Sine
-                tone = Sine(880).to_audio_segment(duration=duration * 1000)
-            except Exception:
-                tone = AudioSegment.silent(duration=int(duration * 1000))
-            tone.export(output_path, format="wav")
+            sr = 24000
+            tone = np.sin(2 * np.pi * 880 * np.arange(int(duration * sr)) / sr).astype(np.float32)
+            sf.write(output_path, tone, sr, subtype="PCM_16")
             return output_path, duration
 
         # If model is available but ref_audio is missing, raise an error so the
@@ -104,11 +263,201 @@ class AudioGenerator:
         duration = len(wav) / sr
         return str(output_path), duration
 
+    @_daemon_routed
+    def preprocess_ref(self, ref_file: str, ref_text: str = "") -> Tuple["torch.Tensor", int, str]:
+        """Preprocess a reference clip once and cache the loaded audio and final ref_text.
+
+        F5TTS.infer re-reads, re-hashes and reloads the reference on every call;
+        callers that reuse a voice should go through this cache instead. Entries
+        are keyed by the file's mtime, so a re-recorded clip is picked up.
+        """
+        key = (ref_file, os.stat(ref_file).st_mtime_ns, ref_text)
+        cached = self._ref_cache.get(key)
+        if cached is None:
+            _drop_stale(self._ref_cache, key)
+            import torchaudio
+            from f5_tts.infer.utils_infer import preprocess_ref_audio_text
+
+            processed_file, final_ref_text = preprocess_ref_audio_text(ref_file, ref_text)
+            audio, sr = torchaudio.load(processed_file)
+            cached = self._ref_cache[key] = (audio, sr, final_ref_text)
+        return cached
+
+    def clear_ref_cache(self) -> None:
+        """Forget every preprocessed reference (and its device copy)."""
+        self._ref_cache.clear()
+        self._batch_ref_cache.clear()
+
+    @_daemon_routed
+    def infer_with_cached_ref(
+        self,
+        ref_file: str,
+        ref_text: str,
+        gen_text: str,
+        nfe_step: int = 32,
+        cfg_strength: float = 2.0,
+        speed: float = 1.0,
+        target_rms: float = 0.1,
+    ) -> Tuple["np.ndarray", int]:
+        """Generate one text from the cached reference, bypassing F5TTS.infer's preprocessing.
+
+        Mirrors infer_process (chunking included) but feeds the cached reference
+        tensors straight into infer_batch_process. Returns (wav, sample_rate).
+        """
+        self._ensure_model()
+        if self._tts is None:
+            raise RuntimeError("F5-TTS model is not available")
+
+        import torch
+        from f5_tts.infer.utils_infer import chunk_text, infer_batch_process
+
+        audio, sr, ref_text = self.preprocess_ref(ref_file, ref_text)
+        ref_seconds = audio.shape[-1] / sr
+        max_chars = int(len(ref_text.encode("utf-8")) / ref_seconds * (22 - ref_seconds) * speed)
+        with torch.inference_mode():
+            wav, wav_sr, _ = next(
+                infer_batch_process(
+                    (audio, sr),
+                    ref_text,
+                    chunk_text(gen_text, max_chars=max_chars),
+                    self._tts.ema_model,
+                    self._tts.vocoder,
+                    mel_spec_type=self._tts.mel_spec_type,
+                    progress=None,
+                    target_rms=target_rms,
+                    nfe_step=nfe_step,
+                    cfg_strength=cfg_strength,
+                    speed=speed,
+                    device=self._tts.device,
+                )
+            )
+        return wav, wav_sr
+
+    @_daemon_routed
+    def infer_batch(
+        self,
+        ref_audio: str,
+        ref_text: str,
+        gen_texts: List[str],
+        speeds: List[float],
+        nfe_step: int = 32,
+        cfg_strength: float = 2.0,
+        target_rms: float = 0.1,
+    ) -> List[Tuple["np.ndarray", int]]:
+        """Generate several texts sharing one reference voice in a single forward pass.
+
+        Texts are padded to a common length and sampled together by the CFM
+        model; each item keeps its own duration (and thus its own speed).
+        Texts too long for a single model chunk fall back to
+        ``infer_with_cached_ref``, which chunks them. Returns one
+        (wav, sample_rate) per text.
+        """
+        self._ensure_model()
+        if self._tts is None:
+            raise RuntimeError("F5-TTS model is not available")
+
+        import torch
+        from f5_tts.infer.utils_infer import target_sample_rate
+        from f5_tts.model.utils import convert_char_to_pinyin
+
+        audio, rms, model_ref_text, ref_seconds, ref_audio_len, ref_text_len = self._batch_ref(
+            ref_audio, ref_text, target_rms
+        )
+
+        results: List[Tuple["np.ndarray", int] | None] = [None] * len(gen_texts)
+        batched: List[int] = []
+        for i, (gen_text, speed) in enumerate(zip(gen_texts, speeds)):
+            # Same per-chunk budget infer_process uses to decide on chunking
+            max_chars = int(ref_text_len / ref_seconds * (22 - ref_seconds) * speed)
+            if len(gen_text.encode("utf-8")) <= max_chars:
+                batched.append(i)
+            else:
+                results[i] = self.infer_with_cached_ref(
+                    ref_audio,
+                    ref_text,
+                    gen_text,
+                    nfe_step=nfe_step,
+                    cfg_strength=cfg_strength,
+                    speed=speed,
+                    target_rms=target_rms,
+                )
+
+        if batched:
+            text_list = convert_char_to_pinyin([model_ref_text + gen_texts[i] for i in batched])
+            durations: List[int] = []
+            for i, text in zip(batched, text_list):
+                gen_text_len = len(gen_texts[i].encode("utf-8"))
+                local_speed = speeds[i] if gen_text_len >= 10 else 0.3
+                duration = ref_audio_len + int(ref_audio_len / ref_text_len * gen_text_len / local_speed)
+                durations.append(max(duration, len(text) + 1, ref_audio_len + 1))
+
+            with torch.inference_mode():
+                generated, _ = self._tts.ema_model.sample(
+                    cond=audio.repeat(len(batched), 1),
+                    text=text_list,
+                    duration=torch.tensor(durations, dtype=torch.long, device=audio.device),
+                    steps=nfe_step,
+                    cfg_strength=cfg_strength,
+                    sway_sampling_coef=-1,
+                )
+                generated = generated.to(torch.float32)
+                for row, (i, duration) in enumerate(zip(batched, durations)):
+                    mel = generated[row : row + 1, ref_audio_len:duration, :].permute(0, 2, 1)
+                    if self._tts.mel_spec_type == "vocos":
+                        wave = self._tts.vocoder.decode(mel)
+                    else:
+                        wave = self._tts.vocoder(mel)
+                    if rms < target_rms:
+                        wave = wave * rms / target_rms
+                    results[i] = (wave.squeeze().cpu().numpy(), target_sample_rate)
+        return results
+
+    def _batch_ref(self, ref_audio: str, ref_text: str, target_rms: float) -> tuple:
+        """Reference conditioning for infer_batch, prepared once per (reference, target_rms).
+
+        Returns (audio, rms, model_ref_text, ref_seconds, ref_audio_len, ref_text_len)
+        with audio mono, loudness-normalized, resampled and already on the model
+        device, so batches of a voice skip the resample and host-to-device copy.
+        """
+        key = (ref_audio, os.stat(ref_audio).st_mtime_ns, ref_text, target_rms)
+        cached = self._batch_ref_cache.get(key)
+        if cached is None:
+            _drop_stale(self._batch_ref_cache, key)
+            import torch
+            import torchaudio
+            from f5_tts.infer.utils_infer import hop_length, target_sample_rate
+
+            audio, sr, model_ref_text = self.preprocess_ref(ref_audio, ref_text)
+            if audio.shape[0] > 1:
+                audio = torch.mean(audio, dim=0, keepdim=True)
+            ref_seconds = audio.shape[-1] / sr
+            rms = torch.sqrt(torch.mean(torch.square(audio)))
+            if rms < target_rms:
+                audio = audio * target_rms / rms
+            if sr != target_sample_rate:
+                audio = torchaudio.transforms.Resample(sr, target_sample_rate)(audio)
+            audio = audio.to(self._tts.device)
+            if len(model_ref_text[-1].encode("utf-8")) == 1:
+                model_ref_text = model_ref_text + " "
+            cached = self._batch_ref_cache[key] = (
+                audio,
+                rms,
+                model_ref_text,
+                ref_seconds,
+                audio.shape[-1] // hop_length,
+                len(model_ref_text.encode("utf-8")),
+            )
+        return cached
+
     def get_audio_duration(self, audio_path: str) -> float:
-        # Use soundfile to determine duration
-        import soundfile as sf
-        with sf.SoundFile(audio_path) as f:
-            return len(f) / f.samplerate
+        # WAV headers are parsed directly; other formats go through soundfile
+        return wav_duration(audio_path)
+
+
+def _drop_stale(cache: dict, key: tuple) -> None:
+    """Evict entries of key's file recorded under another mtime (key is (path, mtime_ns, ...))."""
+    for stale in [k for k in cache if k[0] == key[0] and k[1] != key[1]]:
+        del cache[stale]
 
 
 # CLI entry point
@@ -123,31 +472,32 @@ def _valid_phs(v: str | None) -> bool:
     except Exception:
         return False
 
-# Ensure PYTHONHASHSEED is valid very early
-phs = os.environ.get("PYTHONHASHSEED")
-if not _valid_phs(phs):
-    if os.environ.get("_PHSE_REEXEC") != "1":
-        print(f"⚠️  Invalid PYTHONHASHSEED='{phs}', re-execing with 'random' to avoid runtime crash.")
-        os.environ["PYTHONHASHSEED"] = "random"
-        os.environ["_PHSE_REEXEC"] = "1"
-        import sys
-        os.execv(sys.executable, [sys.executable] + sys.argv)
-    else:
-        print(f"⚠️  Invalid PYTHONHASHSEED='{phs}', forcing 'random' and continuing.")
+
+def _ensure_safe_env() -> None:
+    """Prepare the process environment for the CLI before anything heavy is imported.
+
+    Only called from main(); importing this module as a library has no side effects.
+    """
+    # Ensure PYTHONHASHSEED is valid very early. This interpreter already started,
+    # so only the processes it spawns would crash on it: fixing the environment
+    # they inherit is enough, no need to re-exec (and re-pay startup) ourselves.
+    phs = os.environ.get("PYTHONHASHSEED")
+    if not _valid_phs(phs):
+        log.warning("⚠️  Invalid PYTHONHASHSEED='%s', forcing 'random' and continuing.", phs)
         os.environ["PYTHONHASHSEED"] = "random"
 
-# Limit threaded BLAS/OpenMP usage
-os.environ.setdefault("OMP_NUM_THREADS", "1")
-os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
-os.environ.setdefault("MKL_NUM_THREADS", "1")
-try:
-    import multiprocessing
+    # Limit threaded BLAS/OpenMP usage
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+    os.environ.setdefault("MKL_NUM_THREADS", "1")
     try:
-        multiprocessing.set_start_method('spawn')
-    except RuntimeError:
+        import multiprocessing
+        try:
+            multiprocessing.set_start_method('spawn')
+        except RuntimeError:
+            pass
+    except Exception:
         pass
-except Exception:
-    pass
 
 
 def parse_arguments():
@@ -157,16 +507,25 @@ def parse_arguments():
     parser.add_argument("--output", help="Output directory", default=None)
     parser.add_argument("--workers", type=int, default=4, help="Number of parallel workers (default: 4)")
     parser.add_argument("--verbose", help="Verbose logging", action="store_true")
+    parser.add_argument("--quiet", help="Only log warnings and errors", action="store_true")
+    parser.add_argument(
+        "--daemon", help="Keep the model loaded in a background server shared by later runs", action="store_true"
+    )
     return parser.parse_args()
 
 
 def main():
-    import shutil
+    import sys
+
+    args = parse_arguments()
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    # Level applies to our logger only so --verbose does not surface third-party debug output
+    log.setLevel(logging.WARNING if args.quiet else logging.DEBUG if args.verbose else logging.INFO)
+    _ensure_safe_env()
 
     from .config import ConfigManager
     from .pipeline import GenerationPipeline
 
-    args = parse_arguments()
     # Load config
     if args.config:
         config = ConfigManager.load_config(args.config)
@@ -180,11 +539,19 @@ def main():
     if args.output:
         config.output_dir = args.output
 
-    # Clear output directory
-    output_path = Path(config.output_dir)
-    if output_path.exists():
-        shutil.rmtree(output_path)
-    output_path.mkdir(parents=True, exist_ok=True)
+    # Load the model once in a background daemon (or reuse the running one)
+    if args.daemon and not os.environ.get(DAEMON_SOCK_ENV):
+        from . import server
+
+        address = server.default_address()
+        if not server.is_running(address):
+            server.spawn(args.config, address)
+        os.environ[DAEMON_SOCK_ENV] = address
+
+    # Create the output directory once; existing contents stay, since output/audio/
+    # is the segment cache, keyed on every input of a segment's audio (see
+    # GenerationPipeline._get_audio_path); force_regenerate = true ignores it
+    Path(config.output_dir).mkdir(parents=True, exist_ok=True)
 
     # Default article source: use speech.txt in current directory
     if not args.input and not Path("speech.txt").exists():
@@ -1,40 +1,75 @@
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
+import logging
 import os
+import sys
 import tempfile
 import threading
+import wave
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 from .splitter import ArticleSplitter, SentenceSegment
 from .generator import AudioGenerator, VoiceConfig  # type: ignore
 from .concatenator import FileConcatenator
 from .config import Config, VoiceConfig as VoiceCfg
+from .utils import wav_duration
 import re
 import hashlib
 
+log = logging.getLogger("tts_article")
+
+_SLUG_STRIP_RE = re.compile(r"[^A-Za-z0-9\s]")
+_SLUG_SPACE_RE = re.compile(r"\s+")
+_SLUG_KEEP_RE = re.compile(r"[A-Za-z0-9]")
+
 
 def _sanitize_for_filename(text: str, max_len: int = 60) -> str:
     # Basic slugify: remove punctuation, lowercase, spaces to underscores
     if not isinstance(text, str):
         text = str(text)
-    text = re.sub(r"[^A-Za-z0-9\s]", "", text)
+    if _SLUG_KEEP_RE.search(text) is None:
+        # Nothing survives the strip (CJK-only or punctuation-only text): skip the substitutions
+        return ""
+    if max_len and len(text) > 4 * max_len:
+        # The slug of a prefix is a prefix of the full slug, so when the head
+        # alone fills max_len the rest of a long text need not be scanned
+        head = _sanitize_for_filename(text[: 4 * max_len], max_len=0)
+        if len(head) >= max_len:
+            return head[:max_len]
+    text = _SLUG_STRIP_RE.sub("", text)
     text = text.strip().lower()
-    text = re.sub(r"\s+", "_", text)
+    text = _SLUG_SPACE_RE.sub("_", text)
     if max_len and len(text) > max_len:
         text = text[:max_len]
     return text
 def slugify_text(text: str, max_len: int = 60) -> str:
     return _sanitize_for_filename(text, max_len=max_len)
-from pydub import AudioSegment
 
 
-def _get_ref_text(ref_audio: str, voice_cfg: VoiceCfg | None = None) -> str:
-    """Load ref_text from config or from companion .txt file."""
-    ref_text = voice_cfg.ref_text if voice_cfg else ""
+@lru_cache()
+def _root_speech_text() -> str:
+    """Read the project-level speech.txt fallback once per process."""
+    root_speech = Path(__file__).resolve().parents[1] / "speech.txt"
+    if root_speech.exists():
+        try:
+            return open(root_speech, "r", encoding="utf-8").read().strip()
+        except Exception:
+            return ""
+    return ""
+
+
+@lru_cache(maxsize=None)
+def _resolve_ref_text(ref_audio: str, ref_text: str) -> str:
+    """Resolve ref_text for a reference clip; cached per (ref_audio, configured ref_text)."""
     if not ref_text:
         txt = os.path.splitext(ref_audio)[0] + ".txt"
         if os.path.exists(txt):
@@ -43,28 +78,37 @@ def _get_ref_text(ref_audio: str, voice_cfg: VoiceCfg | None = None) -> str:
             except Exception:
                 ref_text = ""
     if not ref_text:
-        root_speech = Path(__file__).resolve().parents[1] / "speech.txt"
-        if root_speech.exists():
-            try:
-                ref_text = open(root_speech, "r", encoding="utf-8").read().strip()
-            except Exception:
-                ref_text = ""
+        ref_text = _root_speech_text()
     return ref_text or ""
 
 
-def _apply_polyphone_replacements(text: str, polyphone_dict: Dict[str, str] | None) -> str:
-    """Apply polyphone replacements using homophone characters.
+def _get_ref_text(ref_audio: str, voice_cfg: VoiceCfg | None = None) -> str:
+    """Load ref_text from config or from companion .txt file."""
+    return _resolve_ref_text(ref_audio, (voice_cfg.ref_text if voice_cfg else "") or "")
+
 
-    Example: "偏好" -> "偏浩" (hao4 instead of hao3)
-    """
-    if not polyphone_dict:
-        return text
+def _prefetch_file(path: str) -> None:
+    """Ask the OS to read path into the page cache; best effort, errors are ignored."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            while os.read(fd, 1 << 20):
+                pass
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
-    result = text
-    for word, replacement in polyphone_dict.items():
-        if word in result:
-            result = result.replace(word, replacement)
-    return result
+
+@lru_cache(None)
+def _cn2an():
+    import cn2an
+    return cn2an
 
 
 def _convert_nums_to_chinese(text: str) -> str:
@@ -72,10 +116,9 @@ def _convert_nums_to_chinese(text: str) -> str:
 
     Example: "123" -> "一二三", "2024年" -> "二零二四年", "99.9" -> "九十九点九"
     """
-    import cn2an
     try:
         # cn2an.transform with "an2cn" converts all numbers in text to Chinese
-        return cn2an.transform(text, "an2cn")
+        return _cn2an().transform(text, "an2cn")
     except Exception:
         # Fallback: return original text if cn2an fails
         return text
@@ -89,7 +132,55 @@ class GenerationPipeline:
         self.audio_gen = None
         self.concater = FileConcatenator()
         self.voices = config.voices
-        self._gpu_lock = threading.Lock()  # Protect GPU inference on Metal
+        self._backend: str | None = None  # "cuda", "mps" or "cpu", resolved lazily by _gpu_backend
+        self._devices: List[str | None] | None = None  # resolved lazily by _gpu_devices
+        # One AudioGenerator per device, built by run(); worker threads are
+        # pinned to a device slot round-robin (see _worker_slot)
+        self._generators: List[AudioGenerator] = []
+        self._slot_counter = itertools.count()
+        self._thread_state = threading.local()  # per-worker device slot
+        # device slot -> lock of that slot's model: one inference call per model at a time, see _gpu_guard
+        self._model_locks: Dict[int, threading.Lock] = {}
+        # WAV writing and post-processing run here so inference never waits on disk;
+        # created by run() and shut down when it returns
+        self._io_pool: ThreadPoolExecutor | None = None
+        # audio path -> in-flight I/O job, so duplicate segments never touch one file concurrently
+        self._io_jobs: Dict[str, Future] = {}
+        self._io_lock = threading.Lock()
+        # Segment executor, created on first use and reused across runs (see _get_executor)
+        self._exec: ThreadPoolExecutor | None = None
+        self._compile_polyphone()
+        # Per-voice (ref_audio, ref_text, speed, nfe_step, cfg_strength, target_rms), see _build_voice_table
+        self._voice_table: List[Tuple[str, str, float, int, float, float]] = []
+        # Per-voice part of the segment cache key, parallel to _voice_table (see _segment_settings)
+        self._voice_keys: List[tuple] = []
+
+    def _compile_polyphone(self) -> None:
+        """Collapse polyphone_dict into one alternation regex (longest words first)."""
+        polyphone_dict = self.config.polyphone_dict or {}
+        self._poly_map: Dict[str, str] = dict(polyphone_dict)
+        self._poly_re = (
+            re.compile("|".join(re.escape(k) for k in sorted(polyphone_dict, key=len, reverse=True)))
+            if polyphone_dict
+            else None
+        )
+
+    def _apply_polyphone_replacements(self, text: str) -> str:
+        """Apply polyphone replacements using homophone characters.
+
+        Example: "偏好" -> "偏浩" (hao4 instead of hao3)
+        """
+        if self._poly_re is None:
+            return text
+        return self._poly_re.sub(lambda m: self._poly_map[m.group(0)], text)
+
+    def _prepare_text(self, text: str) -> str:
+        """Polyphone replacements followed by numeral conversion; the text fed to the model."""
+        return _convert_nums_to_chinese(self._apply_polyphone_replacements(text))
+
+    def _prepare_texts(self, segments: List[SentenceSegment]) -> Dict[int, str]:
+        """Model input text for every segment, keyed by segment index."""
+        return {seg.index: self._prepare_text(seg.text) for seg in segments}
 
     def _load_article(self) -> str:
         path = Path(self.config.input_article)
@@ -98,99 +189,430 @@ class GenerationPipeline:
         with open(path, "r", encoding="utf-8") as f:
             return f.read()
 
-    def _get_audio_path(self, audio_dir: Path, voice_name: str | None, text: str, speed: float | None = None) -> Path:
+    def _get_audio_path(
+        self, audio_dir: Path, voice_name: str | None, text: str, speed: float | None = None, settings: tuple = ()
+    ) -> Path:
         """Generate deterministic path for audio file based on text content and speed.
 
-        Uses SHA1 hash to ensure cache hits even when text or speed changes.
+        Named {voice}_{slug}_{digest}.wav: the slug is a short human-readable prefix
+        (omitted when the text has no ASCII words), the BLAKE2b digest of voice, text,
+        speed and settings (everything else the audio depends on, see
+        _segment_settings) is the actual cache key.
         """
         voice = voice_name or "main"
         # Include speed in cache key if specified
         cache_key = f"{voice}_{text}_{speed if speed is not None else ''}"
-        hash_suffix = hashlib.sha1(cache_key.encode('utf-8')).hexdigest()
-        return audio_dir / f"{voice}_{hash_suffix}.wav"
+        if settings:
+            cache_key += f"_{settings!r}"
+        digest = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=8).hexdigest()
+        slug = _sanitize_for_filename(text, max_len=40)
+        return audio_dir / (f"{voice}_{slug}_{digest}.wav" if slug else f"{voice}_{digest}.wav")
+
+    def _postprocess_audio(self, audio_path: str, tail_ms: int = 150, fade_ms: int = 30) -> float:
+        """Fade out the speech tail and append silence, working on the PCM samples directly."""
+        import numpy as np
+        import soundfile as sf
 
-    def _postprocess_audio(self, audio_path: str) -> float:
-        """Add silence tail and fade out to audio file."""
         try:
-            seg_audio = AudioSegment.from_wav(audio_path)
-            tail_ms = 150
-            fade_ms = 30 if len(seg_audio) > 2 * 30 else 0
-            seg_audio = seg_audio + AudioSegment.silent(duration=tail_ms)
-            if fade_ms:
-                seg_audio = seg_audio.fade_out(fade_ms)
-            seg_audio.export(audio_path, format="wav")
-            return len(seg_audio) / 1000.0
+            data, sr = sf.read(audio_path, dtype="int16", always_2d=True)
+            fade_samples = int(fade_ms * sr / 1000)
+            if fade_samples and len(data) > 2 * fade_samples:
+                tail = data[-fade_samples:].astype(np.float32)
+                tail *= np.linspace(1.0, 0.0, fade_samples, dtype=np.float32)[:, None]
+                data[-fade_samples:] = tail.astype(np.int16)
+            silence = np.zeros((int(tail_ms * sr / 1000), data.shape[1]), dtype=np.int16)
+            data = np.concatenate([data, silence])
+            sf.write(audio_path, data, sr, subtype="PCM_16")
+            return len(data) / sr
         except Exception:
-            return len(AudioSegment.from_wav(audio_path)) / 1000.0
+            return wav_duration(audio_path)
 
-    def _generate_segment(self, seg: SentenceSegment, speech_types: Dict[str, Tuple[str, str, float]], audio_dir: Path) -> Tuple[int, str, float, str, dict]:
-        """Generate audio for a single segment (runs in worker thread).
+    def _build_voice_table(self, speech_types: Dict[str, Tuple[str, str, float]]) -> Dict[str, int]:
+        """Resolve every voice's reference and generation parameters once.
 
-        Returns: (index, audio_path, duration, original_text, params_dict)
+        Fills self._voice_table with one (ref_audio, ref_text, speed, nfe_step,
+        cfg_strength, target_rms) entry per voice and returns voice name -> table index.
         """
-        ref_audio, ref_text, v_speed = speech_types.get(seg.voice_name, speech_types.get("main"))
+        self._voice_table = []
+        self._voice_keys = []
+        voice_ids: Dict[str, int] = {}
+        # Model settings that change the sampled audio; output/audio/ outlives a run
+        cfg = self.config
+        model_key = (cfg.model_name, cfg.precision, cfg.quantization, cfg.cache_threshold, cfg.cfg_cache)
+        for name, (ref_audio, ref_text, v_speed) in speech_types.items():
+            # Get voice-level parameters (override global if set)
+            voice_cfg = self.voices.get(name) if self.voices else None
+            nfe_step = voice_cfg.nfe_step if voice_cfg and voice_cfg.nfe_step else self.config.nfe_step
+            cfg_strength = voice_cfg.cfg_strength if voice_cfg and voice_cfg.cfg_strength else self.config.cfg_strength
+            target_rms = voice_cfg.target_rms if voice_cfg and voice_cfg.target_rms else self.config.target_rms
+            voice_ids[name] = len(self._voice_table)
+            self._voice_table.append((ref_audio, ref_text, v_speed, nfe_step, cfg_strength, target_rms))
+            try:
+                ref_mtime = os.stat(ref_audio).st_mtime_ns
+            except OSError:
+                ref_mtime = None
+            # The reference is identified by path and mtime, so a re-recorded clip misses
+            self._voice_keys.append(
+                (os.path.abspath(ref_audio), ref_mtime, ref_text, nfe_step, cfg_strength, target_rms, *model_key)
+            )
+        return voice_ids
+
+    def _segment_settings(self, gen_text: str, voice_id: int) -> tuple:
+        """Cache key material besides voice, text and speed.
+
+        The prepared model text (so polyphone and numeral rewrites count), the
+        voice's reference path, mtime and text, its generation parameters and
+        the model settings.
+        """
+        return (gen_text, *self._voice_keys[voice_id])
+
+    def _segment_params(self, seg: SentenceSegment, voice_id: int) -> Tuple[str, str, dict]:
+        """Resolve (ref_audio, ref_text, params) for a segment from its voice table entry."""
+        ref_audio, ref_text, v_speed, nfe_step, cfg_strength, target_rms = self._voice_table[voice_id]
 
         # Use segment-level speed if specified, otherwise fall back to voice/config speed
         final_speed = seg.speed if seg.speed is not None else v_speed
 
-        # Get voice-level parameters (override global if set)
-        voice_cfg = self.voices.get(seg.voice_name) if self.voices else None
-        nfe_step = voice_cfg.nfe_step if voice_cfg and voice_cfg.nfe_step else self.config.nfe_step
-        cfg_strength = voice_cfg.cfg_strength if voice_cfg and voice_cfg.cfg_strength else self.config.cfg_strength
-        target_rms = voice_cfg.target_rms if voice_cfg and voice_cfg.target_rms else self.config.target_rms
-
         params = {
             "speed": final_speed,
             "nfe_step": nfe_step,
             "cfg_strength": cfg_strength,
             "target_rms": target_rms,
         }
+        return ref_audio, ref_text, params
 
-        # Cache key based on original text and speed
-        audio_path = self._get_audio_path(audio_dir, seg.voice_name, seg.text, final_speed)
+    def _gpu_backend(self) -> str:
+        """Return the inference backend ("cuda", "mps" or "cpu"); torch is imported on first call only."""
+        if self._backend is None:
+            try:
+                import torch
+
+                if torch.cuda.is_available():
+                    self._backend = "cuda"
+                elif torch.backends.mps.is_available():
+                    self._backend = "mps"
+                else:
+                    self._backend = "cpu"
+            except ImportError:
+                self._backend = "cpu"
+        return self._backend
+
+    def _gpu_devices(self) -> List[str | None]:
+        """CUDA devices to shard generation across; [None] (the model's default device) otherwise."""
+        if self._devices is None:
+            self._devices = [None]
+            if self._gpu_backend() == "cuda":
+                import torch
+
+                count = torch.cuda.device_count()
+                if count > 1:
+                    self._devices = [f"cuda:{i}" for i in range(count)]
+        return self._devices
+
+    def _worker_slot(self) -> int:
+        """Device slot of the calling thread, assigned round-robin on its first call."""
+        slot = getattr(self._thread_state, "slot", None)
+        if slot is None:
+            slot = self._thread_state.slot = next(self._slot_counter) % len(self._gpu_devices())
+        return slot
+
+    def _worker_gen(self) -> AudioGenerator:
+        """The AudioGenerator on the calling thread's device."""
+        if len(self._generators) > 1:
+            return self._generators[self._worker_slot()]
+        return self.audio_gen
+
+    def _model_lock(self) -> threading.Lock:
+        """Lock of the model on the calling thread's device slot."""
+        return self._model_locks.setdefault(self._worker_slot(), threading.Lock())
+
+    @contextmanager
+    def _gpu_guard(self):
+        """Guard one inference call.
+
+        A model is never sampled by two threads at once on any backend: the DiT
+        keeps per-call state on the module (text embedding and step caches) that
+        a concurrent sample would clobber, and Metal is not thread-safe anyway.
+        Each device's replica has its own lock, so GPUs still run in parallel.
+        On CUDA the call runs with the worker's device current (a no-op unless
+        sharding across GPUs).
+        """
+        with self._model_lock():
+            if self._gpu_backend() != "cuda":
+                yield
+                return
+            import torch
+
+            with torch.cuda.device(self._gpu_devices()[self._worker_slot()]):
+                yield
+
+    def _auto_workers(self) -> int:
+        """Size the segment executor.
+
+        A model only runs one inference call at a time (see _gpu_guard), so GPUs
+        get one thread per loaded model: one on MPS, one per device on CUDA.
+        CPU uses up to the CPU count, so cache hits and WAV bookkeeping still
+        proceed while another thread holds the model.
+        """
+        backend = self._gpu_backend()
+        if backend == "mps":
+            return 1
+        if backend == "cuda":
+            return len(self._gpu_devices())
+        return max(1, min(self.workers, os.cpu_count() or 1))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._exec is None:
+            self._exec = ThreadPoolExecutor(max_workers=self._auto_workers(), thread_name_prefix="tts-gen")
+            atexit.register(self._exec.shutdown, wait=False)
+        return self._exec
+
+    def _submit_io(self, audio_path: Path, fn, *args) -> Future:
+        """Schedule fn(*args) on the I/O pool unless a job for audio_path is already in flight."""
+        with self._io_lock:
+            job = self._io_jobs.get(str(audio_path))
+            if job is None:
+                job = self._io_jobs[str(audio_path)] = self._io_pool.submit(fn, *args)
+            return job
+
+    def _pending_io(self, audio_path: Path) -> Future | None:
+        with self._io_lock:
+            return self._io_jobs.get(str(audio_path))
+
+    def _generate_segment(self, seg: SentenceSegment, gen_text: str, voice_id: int, audio_dir: Path) -> Tuple[int, str, Future, str, dict]:
+        """Generate audio for a single segment (runs in worker thread).
+
+        gen_text is the already prepared model input for seg (see _prepare_text);
+        voice_id indexes the table built by _build_voice_table.
 
-        if audio_path.exists():
-            duration = self._postprocess_audio(str(audio_path))
+        Returns: (index, audio_path, duration_future, original_text, params_dict).
+        The file is written and post-processed on the I/O pool; the future
+        resolves to its duration once it is in place.
+        """
+        ref_audio, ref_text, params = self._segment_params(seg, voice_id)
+        final_speed = params["speed"]
+        nfe_step = params["nfe_step"]
+        cfg_strength = params["cfg_strength"]
+        target_rms = params["target_rms"]
+
+        # Cache key based on original text, speed and everything else the audio depends on
+        audio_path = self._get_audio_path(
+            audio_dir, seg.voice_name, seg.text, final_speed, self._segment_settings(gen_text, voice_id)
+        )
+
+        pending = self._pending_io(audio_path)
+        if pending is not None:
+            return seg.index, str(audio_path), pending, seg.text, params
+        if not self.config.force_regenerate and self._is_cached(audio_path):
+            duration = self._submit_io(audio_path, self._audio_duration, str(audio_path))
             return seg.index, str(audio_path), duration, seg.text, params
 
-        # Generate with temporary file to avoid conflicts
-        with tempfile.NamedTemporaryFile(suffix=".wav", dir=audio_dir, delete=False) as tmp:
-            tmp_path = tmp.name
+        log.debug("[%d] %s (speed=%s)", seg.index, seg.voice_name, final_speed)
+        with self._gpu_guard():
+            wav, sr = self._worker_gen().infer_with_cached_ref(
+                ref_audio,
+                ref_text,
+                gen_text,
+                nfe_step=nfe_step,
+                cfg_strength=cfg_strength,
+                speed=final_speed,
+                target_rms=target_rms,
+            )
+        duration = self._submit_io(audio_path, self._write_segment_audio, audio_path, wav, sr)
+        # Return: index, path, duration, original_text, params
+        return seg.index, str(audio_path), duration, seg.text, params
+
+    @staticmethod
+    def _is_cached(audio_path: Path) -> bool:
+        """A cache entry counts only once its .done marker exists, i.e. it was fully post-processed."""
+        return audio_path.with_suffix(".done").exists() and audio_path.exists()
+
+    @staticmethod
+    def _audio_duration(audio_path: str) -> float:
+        return wav_duration(audio_path)
+
+    def _write_segment_audio(self, audio_path: Path, wav, sr: int) -> float:
+        """Write and post-process generated audio, then atomically move it into the cache.
+
+        The temporary file lives next to audio_path (same filesystem), so os.replace
+        never exposes a partially written cache entry; the .done marker is written
+        last. Returns the duration in seconds.
+        """
+        import soundfile as sf
 
+        fd, tmp_path = tempfile.mkstemp(suffix=".wav", dir=audio_path.parent)
+        os.close(fd)
         try:
-            # Apply polyphone replacements (homophone substitution)
-            gen_text = _apply_polyphone_replacements(seg.text, self.config.polyphone_dict)
-            # Convert Arabic numerals to Chinese characters
-            gen_text = _convert_nums_to_chinese(gen_text)
-
-            # Use lock for GPU inference on Metal (not thread-safe)
-            with self._gpu_lock:
-                wav, sr, spec = self.audio_gen._tts.infer(
-                    ref_file=ref_audio,
-                    ref_text=ref_text,
-                    gen_text=gen_text,
-                    file_wave=tmp_path,
-                    nfe_step=nfe_step,
-                    cfg_strength=cfg_strength,
-                    speed=final_speed,
-                    target_rms=target_rms,
-                )
-            # Rename to final path
-            os.rename(tmp_path, str(audio_path))
-            duration = self._postprocess_audio(str(audio_path))
-            # Return: index, path, duration, original_text, params
-            return seg.index, str(audio_path), duration, seg.text, params
+            sf.write(tmp_path, wav, sr)
+            duration = self._postprocess_audio(tmp_path)
+            os.replace(tmp_path, audio_path)
         except Exception:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
             raise
+        audio_path.with_suffix(".done").touch()
+        return duration
+
+    @staticmethod
+    def _progress_bar(total: int):
+        """A tqdm bar over segments when stderr is a terminal and INFO is logged, else None.
+
+        The bar redraws at most every 0.2 s; without it progress goes to the log
+        in 10% steps (see _log_progress).
+        """
+        if not log.isEnabledFor(logging.INFO) or not sys.stderr.isatty():
+            return None
+        from tqdm import tqdm
+
+        return tqdm(total=total, unit="seg", mininterval=0.2, leave=False)
+
+    @staticmethod
+    def _log_progress(completed: int, total: int, step: int = 1) -> None:
+        """Log progress once per 10% of segments (and on completion) rather than per segment."""
+        if completed == total or completed * 10 // total != (completed - step) * 10 // total:
+            log.info("Progress: %d/%d (%d%%)", completed, total, completed * 100 // total)
+
+    @staticmethod
+    def _group_batches(
+        segments: List[SentenceSegment], batch_size: int, prepped: Dict[int, str] | None = None
+    ) -> List[List[SentenceSegment]]:
+        """Group segments by voice (shared ref_audio/ref_text) into chunks of at most batch_size.
+
+        With prepped (segment index -> model input text), each voice group is
+        ordered by input length before chunking, so a batch holds texts of
+        similar length and little of the padded forward pass is wasted.
+        Segments within a batch stay in article order.
+        """
+        groups: Dict[str, List[SentenceSegment]] = defaultdict(list)
+        for seg in segments:
+            groups[seg.voice_name].append(seg)
+        batches: List[List[SentenceSegment]] = []
+        for group in groups.values():
+            if prepped is not None:
+                group.sort(key=lambda seg: len(prepped[seg.index]))
+            for i in range(0, len(group), batch_size):
+                batch = group[i : i + batch_size]
+                if prepped is not None:
+                    batch.sort(key=lambda seg: seg.index)
+                batches.append(batch)
+        return batches
+
+    def _generate_batch(self, batch: List[SentenceSegment], prepped: Dict[int, str], voice_id: int, audio_dir: Path) -> List[Tuple[int, str, Future, str, dict]]:
+        """Generate audio for segments of one voice with a single batched forward pass.
+
+        Cached segments are returned as-is; a lone uncached segment goes through
+        the regular single-segment path.
+        """
+        results: List[Tuple[int, str, Future, str, dict]] = []
+        pending: List[Tuple[SentenceSegment, dict, Path]] = []
+        for seg in batch:
+            _, _, params = self._segment_params(seg, voice_id)
+            settings = self._segment_settings(prepped[seg.index], voice_id)
+            audio_path = self._get_audio_path(audio_dir, seg.voice_name, seg.text, params["speed"], settings)
+            pending_job = self._pending_io(audio_path)
+            if pending_job is not None:
+                results.append((seg.index, str(audio_path), pending_job, seg.text, params))
+            elif not self.config.force_regenerate and self._is_cached(audio_path):
+                duration = self._submit_io(audio_path, self._audio_duration, str(audio_path))
+                results.append((seg.index, str(audio_path), duration, seg.text, params))
+            else:
+                pending.append((seg, params, audio_path))
+
+        if len(pending) <= 1:
+            results.extend(self._generate_segment(seg, prepped[seg.index], voice_id, audio_dir) for seg, _, _ in pending)
+            return results
+
+        ref_audio, ref_text, params = self._segment_params(pending[0][0], voice_id)
+        with self._gpu_guard():
+            wavs = self._worker_gen().infer_batch(
+                ref_audio,
+                ref_text,
+                [prepped[seg.index] for seg, _, _ in pending],
+                speeds=[p["speed"] for _, p, _ in pending],
+                nfe_step=params["nfe_step"],
+                cfg_strength=params["cfg_strength"],
+                target_rms=params["target_rms"],
+            )
+        for (seg, params, audio_path), (wav, sr) in zip(pending, wavs):
+            duration = self._submit_io(audio_path, self._write_segment_audio, audio_path, wav, sr)
+            results.append((seg.index, str(audio_path), duration, seg.text, params))
+        return results
+
+    @staticmethod
+    def _stitch_wavs(paths: List[str], gap_indices: set, out_path: str, gap_ms: int = 200) -> List[float]:
+        """Concatenate WAV files by copying raw PCM frames into a single output file.
+
+        Zeroed PCM of gap_ms is written before every position in gap_indices.
+        The output format is taken from the first input; inputs in another format
+        are converted with pydub. Returns each input's duration in seconds.
+        """
+        chunk_frames = 1 << 16
+        durations: List[float] = []
+        out = None
+        try:
+            for i, path in enumerate(paths):
+                with wave.open(path, "rb") as w:
+                    fmt = (w.getnchannels(), w.getsampwidth(), w.getframerate())
+                    if out is None:
+                        # Every input is opened exactly once; the first one also fixes the output format
+                        channels, sampwidth, framerate = fmt
+                        out = wave.open(out_path, "wb")
+                        out.setnchannels(channels)
+                        out.setsampwidth(sampwidth)
+                        out.setframerate(framerate)
+                        gap = b"\x00" * (gap_ms * framerate // 1000 * channels * sampwidth)
+                    if i in gap_indices:
+                        out.writeframesraw(gap)
+                    if fmt == (channels, sampwidth, framerate):
+                        durations.append(w.getnframes() / framerate)
+                        while True:
+                            data = w.readframes(chunk_frames)
+                            if not data:
+                                break
+                            out.writeframesraw(data)
+                        continue
+                from pydub import AudioSegment
+
+                seg_audio = (
+                    AudioSegment.from_wav(path)
+                    .set_channels(channels)
+                    .set_sample_width(sampwidth)
+                    .set_frame_rate(framerate)
+                )
+                durations.append(int(seg_audio.frame_count()) / framerate)
+                out.writeframesraw(seg_audio.raw_data)
+        finally:
+            if out is not None:
+                out.close()
+        return durations
 
     def run(self) -> Tuple[str, str]:
+        # Reference texts are cached per run (one read per voice, not per
+        # segment); start fresh so edited companion .txt files are picked up
+        _resolve_ref_text.cache_clear()
+        _root_speech_text.cache_clear()
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-io")
+        try:
+            return self._run()
+        finally:
+            # Every write was awaited by _run (or the run failed); drop leftover
+            # prefetches and release the threads instead of keeping them per pipeline
+            self._io_pool.shutdown(wait=True, cancel_futures=True)
+            # Each voice's reference is encoded once per run; drop the encodings
+            # (device-resident for batching) instead of holding them between runs
+            for gen in self._generators:
+                gen.clear_ref_cache()
+
+    def _run(self) -> Tuple[str, str]:
         article_text = self._load_article()
-        segments = self.splitter.split(article_text)
+        segments = self.splitter.split_parallel(article_text)
         if not segments:
             raise ValueError("No segments produced from article.")
 
+        # Prepare model input text for every segment off the generation path,
+        # overlapping the model load below (which mostly waits on I/O and torch)
+        prep_job = self._io_pool.submit(self._prepare_texts, segments)
+
         # Build voices map
         referenced = set(s.voice_name for s in segments if s.voice_name)
         voices_for_tts = {}
@@ -201,6 +623,14 @@ class GenerationPipeline:
             if self.voices and "main" in self.voices:
                 voices_for_tts["main"] = self.voices["main"]
 
+        # Pull the reference clips (and the "main" fallback) into the page cache
+        # while the model loads, so the first segment of each voice doesn't wait on disk
+        prefetch = {vc.ref_audio for vc in voices_for_tts.values()}
+        if self.voices and "main" in self.voices:
+            prefetch.add(self.voices["main"].ref_audio)
+        for ref_audio in prefetch:
+            self._io_pool.submit(_prefetch_file, ref_audio)
+
         # Build TTS config and initialize model
         from .config import Config as TTSConfig
         tts_config = TTSConfig(
@@ -211,13 +641,26 @@ class GenerationPipeline:
             nfe_step=self.config.nfe_step,
             cfg_strength=self.config.cfg_strength,
             speed=self.config.speed,
+            precision=self.config.precision,
+            quantization=self.config.quantization,
+            compile=self.config.compile,
+            cache_threshold=self.config.cache_threshold,
+            cfg_cache=self.config.cfg_cache,
             voices=voices_for_tts,
         )
-        self.audio_gen = AudioGenerator(tts_config)
-        self.audio_gen.initialize_model()
-
-        if self.audio_gen._tts is None:
-            raise RuntimeError("Failed to initialize TTS model; aborting generation.")
+        # One model replica per GPU when several are visible; workers pick theirs by device slot
+        devices = self._gpu_devices()
+        if len(devices) > 1:
+            log.info("Sharding generation across %d GPUs", len(devices))
+        self._generators = [
+            AudioGenerator(tts_config) if device is None else AudioGenerator(tts_config, device=device)
+            for device in devices
+        ]
+        self.audio_gen = self._generators[0]
+        for gen in self._generators:
+            gen.initialize_model()
+            if not gen.ready:
+                raise RuntimeError("Failed to initialize TTS model; aborting generation.")
 
         # Output directories
         audio_dir = Path(self.config.output_dir) / "audio"
@@ -237,46 +680,85 @@ class GenerationPipeline:
             ref_text = _get_ref_text(vc.ref_audio, vc)
             speech_types[v] = (vc.ref_audio, ref_text, vc.speed if vc.speed is not None else self.config.speed)
 
+        # Preprocess each reference once up front; generation reuses the cached encoding
+        for gen in self._generators:
+            for ref_audio, ref_text, _ in speech_types.values():
+                gen.preprocess_ref(ref_audio, ref_text)
+
         # Handle single voice fallback for missing voices
         default_ref = speech_types.get("main")
         if default_ref is None and speech_types:
             default_ref = list(speech_types.values())[0]
 
+        # Resolve per-voice parameters once; workers index the table by voice id
+        voice_ids = self._build_voice_table(speech_types or {"main": default_ref})
+        default_id = voice_ids.get("main", 0)
+        seg_voice_ids = [voice_ids.get(seg.voice_name, default_id) for seg in segments]
+
+        prepped = prep_job.result()
+
         # Generate all segments
-        # Collect segment metadata: index -> (path, duration, text, voice_name, params)
-        index_to_audio: Dict[int, Tuple[str, float, str, str, dict]] = {}
+        # Per-segment (path, duration, text, voice_name, params) in article order;
+        # the splitter numbers segments 0..n-1, so seg.index is the slot
+        results: List[Tuple[str, Future, str, str, dict] | None] = [None] * len(segments)
+        with self._io_lock:
+            self._io_jobs.clear()
         total_segments = len(segments)
 
-        if use_multispeech and len(segments) > 1:
-            # Parallel generation for multi-voice mode
-            completed = 0
-            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+        bar = self._progress_bar(total_segments)
+
+        def progress(completed: int, total: int, step: int = 1) -> None:
+            if bar is None:
+                self._log_progress(completed, total, step)
+            else:
+                bar.update(step)
+
+        try:
+            if self.config.batch_size > 1:
+                # Batched generation: one forward pass per group of same-voice segments.
+                # A single thread issues every call, one batch after another.
+                completed = 0
+                for batch in self._group_batches(segments, self.config.batch_size, prepped):
+                    voice_id = voice_ids.get(batch[0].voice_name, default_id)
+                    for idx, path, duration, text, params in self._generate_batch(batch, prepped, voice_id, audio_dir):
+                        results[idx] = (path, duration, text, batch[0].voice_name or "main", params)
+                    completed += len(batch)
+                    progress(completed, total_segments, len(batch))
+            elif use_multispeech and len(segments) > 1:
+                # Parallel generation for multi-voice mode
+                completed = 0
+                executor = self._get_executor()
                 futures = {
-                    executor.submit(self._generate_segment, seg, speech_types, audio_dir): seg
-                    for seg in segments
+                    executor.submit(self._generate_segment, seg, prepped[seg.index], voice_id, audio_dir): seg
+                    for seg, voice_id in zip(segments, seg_voice_ids)
                 }
                 for future in as_completed(futures):
                     seg = futures[future]
                     completed += 1
-                    print(f"\rProgress: {completed}/{total_segments} ({completed*100//total_segments}%)", end="", flush=True)
+                    progress(completed, total_segments)
                     try:
                         idx, path, duration, text, params = future.result()
-                        index_to_audio[idx] = (path, duration, text, seg.voice_name or "main", params)
+                        results[idx] = (path, duration, text, seg.voice_name or "main", params)
                     except Exception as e:
-                        print(f"\nError generating segment {seg.index}: {e}")
+                        log.error("Error generating segment %d: %s", seg.index, e)
+                        for pending in futures:
+                            pending.cancel()
                         raise
-            print()  # New line after progress
-        else:
-            # Sequential for single voice or single segment
-            for i, seg in enumerate(segments, 1):
-                print(f"\rProgress: {i}/{total_segments} ({i*100//total_segments}%)", end="", flush=True)
-                idx, path, duration, text, params = self._generate_segment(seg, speech_types or {"main": default_ref}, audio_dir)
-                index_to_audio[idx] = (path, duration, text, seg.voice_name or "main", params)
-            print()  # New line after progress
-
-        # Sort by index to maintain order
-        sorted_indices = sorted(index_to_audio.keys())
-        per_segment_audio_paths = [index_to_audio[i][0] for i in sorted_indices]
+            else:
+                # Sequential for single voice or single segment
+                for i, (seg, voice_id) in enumerate(zip(segments, seg_voice_ids), 1):
+                    idx, path, duration, text, params = self._generate_segment(
+                        seg, prepped[seg.index], voice_id, audio_dir
+                    )
+                    results[idx] = (path, duration, text, seg.voice_name or "main", params)
+                    progress(i, total_segments)
+        finally:
+            if bar is not None:
+                bar.close()
+
+        # Wait for the background writes; re-raises the first write/post-process error
+        results = [(path, duration.result(), text, voice_name, params) for path, duration, text, voice_name, params in results]
+        per_segment_audio_paths = [r[0] for r in results]
 
         # Concatenate all audio and build metadata
         final_audio = Path(self.config.output_dir) / "final_audio.wav"
@@ -286,24 +768,22 @@ class GenerationPipeline:
         current_time = 0.0
 
         if per_segment_audio_paths:
-            from pydub import AudioSegment as _AS
-            combined = _AS.empty()
-            last_path = None
-
-            for idx in sorted_indices:
-                path, duration, text, voice_name, params = index_to_audio[idx]
+            # Repeated consecutive paths get a 200ms silence gap between them
+            gap_indices = {
+                k for k in range(1, len(per_segment_audio_paths))
+                if per_segment_audio_paths[k] == per_segment_audio_paths[k - 1]
+            }
+            self._stitch_wavs(per_segment_audio_paths, gap_indices, str(final_audio))
+
+            # Durations come from post-processing, so no segment file is re-read for metadata
+            for idx, (path, duration, text, voice_name, params) in enumerate(results):
                 start_time = current_time
                 end_time = current_time + duration
 
-                # Add to combined audio
-                if last_path is not None and path == last_path:
-                    combined += _AS.silent(duration=200)
+                if idx in gap_indices:
                     current_time += 0.2  # Add 200ms silence gap
                     end_time = current_time
 
-                combined += _AS.from_wav(path)
-                last_path = path
-
                 # Build segment metadata with params
                 segments_metadata.append({
                     "index": idx,
@@ -321,8 +801,6 @@ class GenerationPipeline:
 
                 current_time += duration
 
-            combined.export(str(final_audio), format="wav")
-
         # Generate metadata JSON file
         metadata = {
             "source_file": self.config.input_article,
@@ -342,6 +820,6 @@ class GenerationPipeline:
         with open(metadata_path, "w", encoding="utf-8") as f:
             json.dump(metadata, f, ensure_ascii=False, indent=2)
 
-        print(f"Metadata saved to: {metadata_path}")
+        log.info("Metadata saved to: %s", metadata_path)
 
         return str(final_audio), ""
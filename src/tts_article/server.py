@@ -0,0 +1,194 @@
+"""Long-lived model server: load F5-TTS once and share it across CLI runs.
+
+``python -m tts_article --daemon`` starts this server in the background on
+first use (or reuses the running one) and exports its socket path as
+``TTS_DAEMON_SOCK``; every AudioGenerator that sees the variable sends its
+inference calls here instead of loading the checkpoint itself. The daemon keeps
+the model settings (model_name, precision, compile, caches) it was started
+with; stop it with ``python -m tts_article.server --stop`` after changing them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import secrets
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+log = logging.getLogger("tts_article")
+
+# Environment variable holding the daemon's socket path, read by AudioGenerator
+DAEMON_SOCK_ENV = "TTS_DAEMON_SOCK"
+
+# AudioGenerator methods a client may call on the daemon
+SERVED_METHODS = frozenset({"generate", "preprocess_ref", "infer_with_cached_ref", "infer_batch"})
+
+
+def default_address() -> str:
+    """Per-user socket path; the directory is private so other users can't send pickles."""
+    sock_dir = Path(tempfile.gettempdir()) / f"tts_article-{os.getuid()}"
+    sock_dir.mkdir(mode=0o700, exist_ok=True)
+    # Another user may have created the name first (or planted a symlink there)
+    st = os.lstat(sock_dir)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        raise RuntimeError(f"Refusing to use {sock_dir}: it must be a directory owned by you with mode 0700")
+    return str(sock_dir / "daemon.sock")
+
+
+def _authkey(address: str) -> bytes:
+    """Secret the daemon and its clients authenticate with before anything is unpickled.
+
+    Kept in a 0600 daemon.key next to the socket, created on first use.
+    """
+    path = os.path.join(os.path.dirname(address), "daemon.key")
+    if not os.path.exists(path):
+        # Written aside and linked into place, so no reader ever sees a partial key
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(secrets.token_bytes(32))
+            os.link(tmp, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp)
+    with open(os.open(path, os.O_RDONLY | os.O_NOFOLLOW), "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) & 0o077:
+            raise RuntimeError(f"Refusing to use {path}: it must be owned by you and private")
+        return f.read()
+
+
+def call(address: str, name: str, args: tuple = (), kwargs: dict | None = None):
+    """Run ``name(*args, **kwargs)`` on the daemon at address and return its result.
+
+    Errors raised in the daemon are re-raised here.
+    """
+    with Client(address, family="AF_UNIX", authkey=_authkey(address)) as conn:
+        conn.send((name, args, kwargs or {}))
+        ok, result = conn.recv()
+    if not ok:
+        raise result
+    return result
+
+
+def is_running(address: str) -> bool:
+    try:
+        return call(address, "ping") is True
+    except (OSError, EOFError, AuthenticationError):
+        return False
+
+
+def serve(generator, address: str) -> None:
+    """Answer requests on address with generator until a "shutdown" request.
+
+    Requests are handled one at a time, so the model is never entered concurrently.
+    Connections that fail the authkey handshake are dropped unread.
+    """
+    if os.path.exists(address) and not is_running(address):
+        os.unlink(address)  # stale socket of a daemon that died
+    with Listener(address, family="AF_UNIX", authkey=_authkey(address)) as listener:
+        log.info("Model daemon listening on %s", address)
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError) as e:
+                log.warning("Rejected daemon connection: %s", e)
+                continue
+            with conn:
+                try:
+                    name, args, kwargs = conn.recv()
+                except EOFError:
+                    continue
+                if name == "ping":
+                    conn.send((True, True))
+                    continue
+                if name == "shutdown":
+                    conn.send((True, None))
+                    break
+                try:
+                    if name not in SERVED_METHODS:
+                        raise ValueError(f"Unknown daemon request: {name!r}")
+                    reply = (True, getattr(generator, name)(*args, **kwargs))
+                except Exception as e:
+                    log.error("Daemon request %s failed: %s", name, e)
+                    reply = (False, e)
+                try:
+                    conn.send(reply)
+                except Exception as e:
+                    # Unpicklable exception (or result); still let the client fail cleanly
+                    conn.send((False, RuntimeError(f"{name} failed: {e!r}")))
+    log.info("Model daemon stopped")
+
+
+def spawn(config_path: str | None, address: str, timeout: float = 600.0) -> None:
+    """Start a detached daemon on address and wait until it answers.
+
+    The daemon outlives this process; its output goes to daemon.log next to the socket.
+    """
+    cmd = [sys.executable, "-m", "tts_article.server", "--address", address]
+    if config_path:
+        cmd += ["--config", os.path.abspath(config_path)]
+    log_path = os.path.join(os.path.dirname(address), "daemon.log")
+    env = dict(os.environ)
+    env.pop(DAEMON_SOCK_ENV, None)
+    with open(log_path, "ab") as out:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=out, stderr=subprocess.STDOUT, env=env, start_new_session=True
+        )
+    log.info("Starting model daemon (pid %d), loading the model...", proc.pid)
+    deadline = time.monotonic() + timeout
+    while not is_running(address):
+        if proc.poll() is not None:
+            raise RuntimeError(f"Model daemon exited with code {proc.returncode}; see {log_path}")
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Model daemon did not start within {timeout:.0f}s; see {log_path}")
+        time.sleep(0.5)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TTS Article model daemon")
+    parser.add_argument("--config", help="Path to TOML config file", default=None)
+    parser.add_argument("--address", help="Socket path (default: per-user temp dir)", default=None)
+    parser.add_argument("--stop", help="Stop the running daemon", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    log.setLevel(logging.INFO)
+    address = args.address or default_address()
+
+    if args.stop:
+        if is_running(address):
+            call(address, "shutdown")
+            print("Model daemon stopped")
+        else:
+            print("No model daemon running")
+        return
+
+    from .config import ConfigManager
+    from .generator import AudioGenerator, _ensure_safe_env
+
+    _ensure_safe_env()
+    os.environ.pop(DAEMON_SOCK_ENV, None)  # the daemon itself runs the model
+    if args.config:
+        config = ConfigManager.load_config(args.config)
+    elif Path("config.toml").exists():
+        config = ConfigManager.load_config("config.toml")
+    else:
+        config = ConfigManager.get_default_config()
+    generator = AudioGenerator(config)
+    generator.initialize_model()
+    if generator._tts is None:
+        raise RuntimeError("Failed to initialize TTS model")
+    serve(generator, address)
+
+
+if __name__ == "__main__":
+    main()
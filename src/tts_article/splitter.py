@@ -1,12 +1,39 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Iterator, List, Tuple
 import re
 
+_JSON_BLOCK_RE = re.compile(r"\{[^}]+\}")
+# Sentence punctuation: a zero-width split just after each delimiter keeps the
+# punctuation attached to the preceding piece in one C-level pass (str.translate
+# with multi-character replacements takes a slow path on non-ASCII text).
+_PUNCT_SPLIT_RE = re.compile(r'(?<=[。！？!.?；;,，])')
+_COMMA_SPLIT_RE = re.compile(r'[，,]+\s*')
+_VOICE_MARKER_RE = re.compile(r"\[([^\]]+)\]")
+_WHITESPACE_RE = re.compile(r"\s")
+# Same boundaries as str.splitlines(), with the whitespace around each break
+# consumed by the split so lines come out trimmed.
+_LINE_SPLIT_RE = re.compile(r"\s*[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]\s*")
 
-@dataclass
+# Fast path for the usual flat voice blocks ({"name": "f-a/happy", "speed": 1}):
+# escape-free strings, numbers and literals only. Anything else goes to json.loads.
+_JSON_SCALAR = r'(?:"[^"\\\x00-\x1f]*"|-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null)'
+_JSON_FIELD = r'\s*"[^"\\\x00-\x1f]*"\s*:\s*' + _JSON_SCALAR + r'\s*'
+_FLAT_JSON_RE = re.compile(r'\{' + _JSON_FIELD + r'(?:,' + _JSON_FIELD + r')*\}')
+_JSON_FIELD_RE = re.compile(r'"([^"]*)"\s*:\s*(' + _JSON_SCALAR + r')')
+_JSON_LITERALS = {"true": True, "false": False, "null": None}
+
+# Below this many characters split_parallel splits in-process
+_PARALLEL_MIN_CHARS = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
 class SentenceSegment:
     index: int
     text: str
@@ -18,20 +45,26 @@ class ArticleSplitter:
     def __init__(self, max_length: int = 200):
         self.max_length = max_length
 
+    # Text is stripped once, where lines are cut in _split_text_to_candidates.
+    # The helpers below take stripped input; comma pieces may keep whitespace
+    # that preceded the comma, so _split_text_to_candidates strips the pieces
+    # of long lines once more and drops any that end up empty.
+
     def _split_by_punctuation(self, text: str) -> List[str]:
         if not text:
             return []
         # Split on common punctuation, keep the punctuation at the end of segments when possible
-        parts = re.split(r'(?<=[。！？!.?；;,，])\s*', text)
-        raw_segments = [p.strip() for p in parts if p.strip()]
+        parts = _PUNCT_SPLIT_RE.split(text)
+        raw_segments = [p for p in map(str.strip, parts) if p]
         # Enforce max_length by further splitting long segments
         segments: List[str] = []
+        append, extend, max_length = segments.append, segments.extend, self.max_length
         for seg in raw_segments:
-            if len(seg) <= self.max_length:
-                segments.append(seg)
+            if len(seg) <= max_length:
+                append(seg)
             else:
-                segments.extend(self._split_long_segment(seg))
-        return segments if segments else [text.strip()]
+                extend(self._split_long_segment(seg))
+        return segments
 
     def _split_long_segment(self, segment: str) -> List[str]:
         """Split a long text segment into smaller pieces no longer than
@@ -43,26 +76,31 @@ class ArticleSplitter:
         - Then split at whitespace for English text
         - Fallback: hard-split by characters preserving max_length
         """
-        seg = segment.strip()
+        seg = segment
         if not seg:
             return []
 
-        # Try splitting at Chinese/English commas first
-        if '，' in seg or ',' in seg:
-            parts = re.split(r'[，,]+\s*', seg)
+        # Try splitting at Chinese/English commas first. The split doubles as
+        # the comma probe: a single part means there was nothing to split on.
+        parts = _COMMA_SPLIT_RE.split(seg)
+        if len(parts) > 1:
             parts = [p for p in parts if p]
             out: List[str] = []
-            cur = ''
+            cur_parts: List[str] = []
+            cur_len = 0
             for p in parts:
-                if not cur:
-                    cur = p
-                elif len(cur) + 1 + len(p) <= self.max_length:
-                    cur = cur + '，' + p
+                if not cur_parts:
+                    cur_parts.append(p)
+                    cur_len = len(p)
+                elif cur_len + 1 + len(p) <= self.max_length:
+                    cur_parts.append(p)
+                    cur_len += 1 + len(p)
                 else:
-                    out.append(cur)
-                    cur = p
-            if cur:
-                out.append(cur)
+                    out.append('，'.join(cur_parts))
+                    cur_parts = [p]
+                    cur_len = len(p)
+            if cur_parts:
+                out.append('，'.join(cur_parts))
             # If any part still too long, recursively split
             result: List[str] = []
             for o in out:
@@ -73,12 +111,20 @@ class ArticleSplitter:
                     result.extend(self._split_long_segment_by_whitespace(o))
             return result
 
-        # Try splitting by whitespace (English long text)
-        if re.search(r"\s+", seg):
+        # Try splitting by whitespace (English long text); any Unicode
+        # whitespace counts (NBSP, thin spaces, ...), as str.split() does
+        if _WHITESPACE_RE.search(seg):
             return self._split_long_segment_by_whitespace(seg)
 
         # Fallback: hard split by max_length
-        return [seg[i : i + self.max_length].strip() for i in range(0, len(seg), self.max_length)]
+        return self._hard_split(seg)
+
+    def _hard_split(self, seg: str) -> List[str]:
+        # Normally reached for whitespace-free runs (a single over-long word or a
+        # segment with no spaces at all); slices are still stripped so a cut never
+        # leaves whitespace at a piece's edge, and empty slices are dropped.
+        n = self.max_length
+        return [p for p in (seg[i : i + n].strip() for i in range(0, len(seg), n)) if p]
 
     def _split_long_segment_by_whitespace(self, seg: str) -> List[str]:
         words = seg.split()
@@ -91,7 +137,8 @@ class ArticleSplitter:
                 cur_words.append(w)
                 cur_len += add_len
             else:
-                out.append(' '.join(cur_words))
+                if cur_words:
+                    out.append(' '.join(cur_words))
                 cur_words = [w]
                 cur_len = len(w)
         if cur_words:
@@ -102,128 +149,187 @@ class ArticleSplitter:
             if len(o) <= self.max_length:
                 final.append(o)
             else:
-                final.extend([o[i : i + self.max_length].strip() for i in range(0, len(o), self.max_length)])
+                final.extend(self._hard_split(o))
         return final
 
-    def _parse_voice_markers(self, text: str) -> List[Tuple[str, str]]:
-        # Extract [voice] markers and associate following text until the next marker
-        segments: List[Tuple[str, str]] = []
+    @staticmethod
+    def _strip_bounds(text: str, start: int, end: int) -> Tuple[int, int]:
+        """Return ``(start, end)`` narrowed past surrounding whitespace, without slicing."""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    def _parse_voice_markers(self, text: str) -> List[Tuple[str, int, int]]:
+        # Extract [voice] markers and associate following text until the next marker.
+        # Spans are (voice, start, end) offsets into ``text`` with surrounding
+        # whitespace already trimmed; callers slice only what they keep.
+        segments: List[Tuple[str, int, int]] = []
         current_voice = "main"
-        pattern = re.compile(r"\[([^\]]+)\]")
         pos = 0
-        for m in pattern.finditer(text):
-            before = text[pos:m.start()]
-            if before.strip():
-                segments.append((current_voice, before))
-            current_voice = m.group(1).strip()
+        for m in _VOICE_MARKER_RE.finditer(text):
+            start, end = self._strip_bounds(text, pos, m.start())
+            if start < end:
+                segments.append((current_voice, start, end))
+            current_voice = sys.intern(m.group(1).strip())
             pos = m.end()
-        tail = text[pos:]
-        if tail.strip():
-            segments.append((current_voice, tail))
+        start, end = self._strip_bounds(text, pos, len(text))
+        if start < end:
+            segments.append((current_voice, start, end))
         if not segments:
-            segments.append(("main", text))
+            segments.append(("main", *self._strip_bounds(text, 0, len(text))))
         return segments
 
     def _split_by_json_blocks(self, text: str) -> List[Tuple[str, str, float | None]]:
         # Detect blocks like: {"name": "f-a/happy", "seed": -1, "speed": 1} 这段文本
+        # Single streaming pass: each block's text runs up to the start of the next match,
+        # so keep one match behind instead of materializing the whole match list.
         blocks = []
-        pattern = re.compile(r"\{[^}]+\}")
-        matches = list(pattern.finditer(text))
-        if not matches:
-            return []
-        for i, m in enumerate(matches):
-            json_str = m.group(0)
-            try:
-                cfg = json.loads(json_str)
-            except Exception:
-                continue
-            voice_name = cfg.get("name", "main")
-            speed = cfg.get("speed", None)
-            start = m.end()
-            end = matches[i+1].start() if i + 1 < len(matches) else len(text)
-            segment_text = text[start:end].strip()
-            if segment_text:
-                blocks.append((voice_name, segment_text, speed))
+        prev = None
+        for m in _JSON_BLOCK_RE.finditer(text):
+            if prev is not None:
+                self._append_json_block(blocks, text, prev, m.start())
+            prev = m
+        if prev is not None:
+            self._append_json_block(blocks, text, prev, len(text))
         return blocks
 
+    @staticmethod
+    def _parse_json_block(raw: str) -> dict | None:
+        if _FLAT_JSON_RE.fullmatch(raw):
+            cfg = {}
+            for key, value in _JSON_FIELD_RE.findall(raw):
+                if value[0] == '"':
+                    cfg[key] = value[1:-1]
+                elif value in _JSON_LITERALS:
+                    cfg[key] = _JSON_LITERALS[value]
+                elif '.' in value or 'e' in value or 'E' in value:
+                    cfg[key] = float(value)
+                else:
+                    cfg[key] = int(value)
+            return cfg
+        try:
+            return json.loads(raw)
+        except Exception:
+            return None
+
+    @classmethod
+    def _append_json_block(cls, blocks: List[Tuple[str, str, float | None]], text: str, m: re.Match, end: int) -> None:
+        cfg = cls._parse_json_block(m.group(0))
+        if cfg is None:
+            return
+        segment_text = text[m.end():end].strip()
+        if segment_text:
+            name = cfg.get("name", "main")
+            if isinstance(name, str):
+                name = sys.intern(name)
+            blocks.append((name, segment_text, cfg.get("speed", None)))
+
     def split(self, article: str, default_voice: str = "main") -> List[SentenceSegment]:
-        # First try JSON-block based segmentation (experimental multi-voice JSON markers)
-        blocks = self._split_by_json_blocks(article)
-        segments: List[SentenceSegment] = []
+        return list(_split_cached(self.max_length, default_voice, article))
+
+    def iter_split(self, article: str, default_voice: str = "main") -> Iterator[SentenceSegment]:
+        """Yield segments in article order as they are produced.
+
+        Same output as :meth:`split`, without holding the whole list, so a
+        streaming consumer can start synthesis on the first segment.
+        """
         idx = 0
-        if blocks:
-            for voice, text, speed in blocks:
-                text = text.strip()
-                if not text:
-                    continue
-                # Prefer preserving original line breaks: treat each non-empty
-                # input line as a primary sentence. Only split lines further if
-                # they exceed max_length.
-                lines = [l.strip() for l in text.splitlines() if l.strip()]
-                if not lines:
-                    # fallback to punctuation-based splitting
-                    candidates = self._split_by_punctuation(text)
-                else:
-                    candidates = []
-                    for line in lines:
-                        if len(line) <= self.max_length:
-                            candidates.append(line)
-                        else:
-                            # split long lines by punctuation first, then hard split
-                            parts = self._split_by_punctuation(line)
-                            for p in parts:
-                                if len(p) <= self.max_length:
-                                    candidates.append(p)
-                                else:
-                                    candidates.extend(self._split_long_segment(p))
+        for voice, text, speed in self._voice_spans(article, default_voice):
+            for s in self._split_text_to_candidates(text):
+                yield SentenceSegment(index=idx, text=s, voice_name=voice, speed=speed)
+                idx += 1
+
+    def split_parallel(self, article: str, default_voice: str = "main", workers: int | None = None) -> List[SentenceSegment]:
+        """Same output as :meth:`split`, with the sentence splitting of very long
+        articles spread over worker processes.
 
+        Voice spans are resolved serially (markers carry state across lines);
+        their text is then cut at line breaks, which never change the result,
+        into one chunk per task. Articles under _PARALLEL_MIN_CHARS go through
+        :meth:`split`, since starting the pool would cost more than it saves.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers < 2 or len(article) < _PARALLEL_MIN_CHARS:
+            return self.split(article, default_voice)
+
+        spans = list(self._voice_spans(article, default_voice))
+        target = max(len(article) // (4 * workers), 1)
+        tasks: List[Tuple[int, str]] = []
+        owners: List[int] = []  # span index of each task
+        for n, (_, text, _) in enumerate(spans):
+            for chunk in _line_chunks(text, target):
+                tasks.append((self.max_length, chunk))
+                owners.append(n)
+
+        segments: List[SentenceSegment] = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for n, candidates in zip(owners, pool.map(_split_chunk, tasks)):
+                voice, _, speed = spans[n]
                 for s in candidates:
-                    s = s.strip()
-                    if not s:
-                        continue
-                    segments.append(SentenceSegment(index=idx, text=s, voice_name=voice, speed=speed))
-                    idx += 1
-            # normalize indices
-            for i, seg in enumerate(segments):
-                seg.index = i
-            return segments
+                    segments.append(SentenceSegment(index=len(segments), text=s, voice_name=voice, speed=speed))
+        return segments
+
+    def _voice_spans(self, article: str, default_voice: str) -> Iterator[Tuple[str, str, float | None]]:
+        """Yield (voice, stripped text, speed) for each voice span of the article, in order."""
+        # First try JSON-block based segmentation (experimental multi-voice JSON markers).
+        # Plain articles have no braces or brackets; a substring test skips the regex scans.
+        blocks = self._split_by_json_blocks(article) if '{' in article else []
+        if blocks:
+            yield from blocks
+            return
 
         # Fallback: simple [voice] markers
-        pieces = self._parse_voice_markers(article)
-        for voice, text in pieces:
-            text = text.strip()
-            if not text:
-                continue
-            # Respect original lines first (one line => one segment). If a
-            # line is too long, fall back to punctuation/long-segment splitting.
-            lines = [l.strip() for l in text.splitlines() if l.strip()]
-            if lines:
-                for line in lines:
-                    if len(line) <= self.max_length:
-                        segments.append(SentenceSegment(index=idx, text=line, voice_name=voice or default_voice))
-                        idx += 1
-                    else:
-                        parts = self._split_by_punctuation(line)
-                        for p in parts:
-                            p = p.strip()
-                            if not p:
-                                continue
-                            if len(p) <= self.max_length:
-                                segments.append(SentenceSegment(index=idx, text=p, voice_name=voice or default_voice))
-                                idx += 1
-                            else:
-                                for sub in self._split_long_segment(p):
-                                    segments.append(SentenceSegment(index=idx, text=sub, voice_name=voice or default_voice))
-                                    idx += 1
+        if '[' in article:
+            spans = self._parse_voice_markers(article)
+        else:
+            spans = [("main", *self._strip_bounds(article, 0, len(article)))]
+        for voice, start, end in spans:
+            yield voice or default_voice, article[start:end], None
+
+    def _split_text_to_candidates(self, text: str) -> List[str]:
+        """Split one voice's text into sentence strings within max_length.
+
+        Original line breaks win: each non-empty line is a primary sentence,
+        and only lines over max_length are split further by punctuation and
+        then by :meth:`_split_long_segment`.
+        """
+        lines = [l for l in _LINE_SPLIT_RE.split(text) if l]
+        candidates: List[str] = []
+        append, extend, max_length = candidates.append, candidates.extend, self.max_length
+        for line in lines:
+            if len(line) <= max_length:
+                append(line)
             else:
-                sentences = self._split_by_punctuation(text)
-                for s in sentences:
-                    s = s.strip()
-                    if not s:
-                        continue
-                    segments.append(SentenceSegment(index=idx, text=s, voice_name=voice or default_voice))
-                    idx += 1
-        # Normalize indices
-        for i, seg in enumerate(segments):
-            seg.index = i
-        return segments
+                # punctuation first; _split_by_punctuation hard-splits what is still too long.
+                # Comma pieces can keep the whitespace before a comma, so strip and drop empties.
+                extend(filter(None, map(str.strip, self._split_by_punctuation(line))))
+        return candidates
+
+
+def _line_chunks(text: str, target: int) -> Iterator[str]:
+    """Cut stripped text at line breaks into stripped chunks of roughly target characters."""
+    start = 0
+    while start < len(text):
+        cut = text.find('\n', start + target)
+        if cut < 0:
+            cut = len(text)
+        chunk = text[start:cut].strip()
+        if chunk:
+            yield chunk
+        start = cut + 1
+
+
+def _split_chunk(task: Tuple[int, str]) -> List[str]:
+    # Worker entry point for ArticleSplitter.split_parallel (module level so it pickles)
+    max_length, text = task
+    return ArticleSplitter(max_length)._split_text_to_candidates(text)
+
+
+@lru_cache(maxsize=64)
+def _split_cached(max_length: int, default_voice: str, article: str) -> Tuple[SentenceSegment, ...]:
+    # Splitting is pure in (max_length, default_voice, article) and segments are
+    # frozen, so re-splitting the same article shares one tuple. str caches its
+    # own hash, so keying on the article costs one pass per new string.
+    return tuple(ArticleSplitter(max_length).iter_split(article, default_voice))
@@ -1,6 +1,59 @@
 from __future__ import annotations
 
-import re
+import os
+import struct
+
 
 def remove_voice_markers(text: str) -> str:
-    return re.sub(r"\[[^\]]+\]", "", text).strip()
+    # Drop every non-empty [...] marker with a str.find scan; "[]" is kept as
+    # literal text, matching the old r"\[[^\]]+\]" substitution.
+    out = []
+    pos = 0
+    start = 0
+    while True:
+        i = text.find('[', start)
+        if i < 0:
+            break
+        j = text.find(']', i + 1)
+        if j < 0:
+            break
+        if j == i + 1:
+            start = j + 1
+            continue
+        out.append(text[pos:i])
+        pos = start = j + 1
+    out.append(text[pos:])
+    return ''.join(out).strip()
+
+
+def wav_duration(path: str) -> float:
+    """Duration in seconds of an audio file, read from the RIFF header for WAV.
+
+    Walks the WAV chunk headers with struct instead of opening the file through
+    libsndfile; anything else (other formats, RF64, streamed headers with no
+    data size) goes through soundfile.
+    """
+    with open(path, "rb") as f:
+        head = f.read(12)
+        if len(head) == 12 and head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+            rate = block_align = 0
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    break
+                cid, size = struct.unpack("<4sI", chunk)
+                if cid == b"data":
+                    if rate and block_align and size not in (0, 0xFFFFFFFF):
+                        # A truncated file holds fewer samples than its header claims
+                        size = min(size, os.fstat(f.fileno()).st_size - f.tell())
+                        return size // block_align / rate
+                    break
+                if cid == b"fmt ":
+                    fmt = f.read(size + (size & 1))
+                    if len(fmt) >= 14:
+                        _, _, rate, _, block_align = struct.unpack_from("<HHIIH", fmt)
+                else:
+                    f.seek(size + (size & 1), 1)
+    import soundfile as sf
+
+    return sf.info(path).duration
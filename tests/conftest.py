@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def dummy_voice(tmp_path_factory):
+    """A placeholder reference .wav shared by every test in the session."""
+    path = tmp_path_factory.mktemp("voices") / "voice.wav"
+    path.write_text("dummy wav")
+    return path
+
+
+@pytest.fixture(scope="session")
+def dummy_article(tmp_path_factory):
+    """A placeholder input article shared by every test in the session."""
+    path = tmp_path_factory.mktemp("articles") / "article.txt"
+    path.write_text("Test article")
+    return path
@@ -14,18 +14,11 @@ from src.tts_article.config import Config, ConfigManager, VoiceConfig
 class TestConfigManager:
     """Test suite for ConfigManager class."""
 
-    def test_load_config_valid(self, tmp_path):
-        """Test loading a valid TOML configuration file."""
-        # Create a temporary voice file
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
-
-        # Create a temporary article file
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
-        # Create a valid TOML config
-        config_file = tmp_path / "config.toml"
+    def test_load_config_valid(self):
+        """Test loading a valid TOML configuration."""
+        # load_config does not check paths, so parse the TOML text directly
+        article_file = "article.txt"
+        voice_file = "test_voice.wav"
         config_content = f"""
 input_article = "{article_file}"
 output_dir = "output"
@@ -45,10 +38,7 @@ speed = 1.2
 ref_audio = "{voice_file}"
 ref_text = ""
 """
-        config_file.write_text(config_content)
-
-        # Load config
-        config = ConfigManager.load_config(str(config_file))
+        config = ConfigManager.loads(config_content)
 
         # Verify loaded values
         assert config.input_article == str(article_file)
@@ -77,29 +67,16 @@ ref_text = ""
         assert narrator_voice.ref_text == ""
         assert narrator_voice.speed is None
 
-    def test_load_config_with_defaults(self, tmp_path):
+    def test_load_config_with_defaults(self):
         """Test loading config with default values for optional fields."""
-        # Create a temporary voice file
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
-
-        # Create a temporary article file
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
-        # Create a minimal TOML config (only required fields)
-        config_file = tmp_path / "config.toml"
-        config_content = f"""
-input_article = "{article_file}"
+        # Minimal TOML config (only required fields)
+        config = ConfigManager.loads("""
+input_article = "article.txt"
 output_dir = "output"
 
 [voices.main]
-ref_audio = "{voice_file}"
-"""
-        config_file.write_text(config_content)
-
-        # Load config
-        config = ConfigManager.load_config(str(config_file))
+ref_audio = "test_voice.wav"
+""")
 
         # Verify default values are used
         assert config.max_sentence_length == 200
@@ -114,69 +91,106 @@ ref_audio = "{voice_file}"
         with pytest.raises(FileNotFoundError, match="Configuration file not found"):
             ConfigManager.load_config("nonexistent_config.toml")
 
-    def test_load_config_invalid_toml(self, tmp_path):
+    def test_load_config_invalid_toml(self):
         """Test loading config with invalid TOML syntax."""
-        config_file = tmp_path / "invalid.toml"
-        config_file.write_text("invalid toml [[[")
-
         with pytest.raises(ValueError, match="Failed to parse TOML file"):
-            ConfigManager.load_config(str(config_file))
+            ConfigManager.loads("invalid toml [[[")
+
+    def test_load_config_prefers_fast_toml_backend(self, tmp_path):
+        """Test that an installed rtoml is used ahead of tomllib."""
+        import sys
+        import types
+        from unittest.mock import Mock, patch
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('input_article = "a.txt"\n')
+        fake = types.ModuleType("rtoml")
+        fake.loads = Mock(return_value={
+            "input_article": "a.txt",
+            "output_dir": "out",
+            "voices": {"main": {"ref_audio": "main.wav", "ref_text": "hi"}},
+        })
+        with patch.dict(sys.modules, {"rtoml": fake}), \
+                patch("src.tts_article.config._toml", None):
+            config = ConfigManager.load_config(str(config_file))
+        fake.loads.assert_called_once()
+        assert config.output_dir == "out"
+
+    def test_load_config_reuses_parse_until_file_changes(self, tmp_path):
+        """Test repeat loads skip parsing and hand out independent copies."""
+        from unittest.mock import patch
+        import src.tts_article.config as config_module
 
-    def test_load_config_missing_required_field_input_article(self, tmp_path):
-        """Test loading config missing input_article field."""
         config_file = tmp_path / "config.toml"
-        config_content = """
+        config_file.write_text('input_article = "a.txt"\noutput_dir = "out"\n[voices.main]\nref_audio = "m.wav"\nref_text = "hi"\n')
+        first = ConfigManager.load_config(str(config_file))
+        first.output_dir = "changed"
+        with patch.object(config_module, "_toml_loads", wraps=config_module._toml_loads) as parse:
+            second = ConfigManager.load_config(str(config_file))
+            parse.assert_not_called()
+            assert second.output_dir == "out"
+
+            config_file.write_text('input_article = "a.txt"\noutput_dir = "other"\n[voices.main]\nref_audio = "m.wav"\nref_text = "hi"\n')
+            assert ConfigManager.load_config(str(config_file)).output_dir == "other"
+            parse.assert_called_once()
+
+            ConfigManager.clear_cache()
+            ConfigManager.load_config(str(config_file))
+            assert parse.call_count == 2
+
+    def test_load_config_cache_keys_on_absolute_path(self, tmp_path, monkeypatch):
+        """Test one relative path loaded from two directories returns each directory's config."""
+        body = 'input_article = "a.txt"\noutput_dir = "{}"\n[voices.main]\nref_audio = "m.wav"\nref_text = "hi"\n'
+        for name in ("one", "two"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "config.toml").write_text(body.format(name))
+        # Same size and (usually) the same mtime: only the directory tells them apart
+        os.utime(tmp_path / "two" / "config.toml", ns=(0, os.stat(tmp_path / "one" / "config.toml").st_mtime_ns))
+
+        monkeypatch.chdir(tmp_path / "one")
+        assert ConfigManager.load_config("config.toml").output_dir == "one"
+        monkeypatch.chdir(tmp_path / "two")
+        assert ConfigManager.load_config("config.toml").output_dir == "two"
+
+    def test_load_config_missing_required_field_input_article(self):
+        """Test loading config missing input_article field."""
+        with pytest.raises(ValueError, match="Missing required field: input_article"):
+            ConfigManager.loads("""
 output_dir = "output"
 
 [voices.main]
 ref_audio = "voice.wav"
-"""
-        config_file.write_text(config_content)
+""")
 
-        with pytest.raises(ValueError, match="Missing required field: input_article"):
-            ConfigManager.load_config(str(config_file))
-
-    def test_load_config_missing_required_field_output_dir(self, tmp_path):
+    def test_load_config_missing_required_field_output_dir(self):
         """Test loading config missing output_dir field."""
-        config_file = tmp_path / "config.toml"
-        config_content = """
+        with pytest.raises(ValueError, match="Missing required field: output_dir"):
+            ConfigManager.loads("""
 input_article = "article.txt"
 
 [voices.main]
 ref_audio = "voice.wav"
-"""
-        config_file.write_text(config_content)
+""")
 
-        with pytest.raises(ValueError, match="Missing required field: output_dir"):
-            ConfigManager.load_config(str(config_file))
-
-    def test_load_config_no_voices(self, tmp_path):
+    def test_load_config_no_voices(self):
         """Test loading config without any voices configured."""
-        config_file = tmp_path / "config.toml"
-        config_content = """
+        with pytest.raises(ValueError, match="At least one voice must be configured"):
+            ConfigManager.loads("""
 input_article = "article.txt"
 output_dir = "output"
-"""
-        config_file.write_text(config_content)
-
-        with pytest.raises(ValueError, match="At least one voice must be configured"):
-            ConfigManager.load_config(str(config_file))
+""")
 
-    def test_load_config_invalid_voice_config(self, tmp_path):
+    def test_load_config_invalid_voice_config(self):
         """Test loading config with invalid voice configuration."""
-        config_file = tmp_path / "config.toml"
-        config_content = """
+        with pytest.raises(ValueError, match="Missing 'ref_audio' for voice 'main'"):
+            ConfigManager.loads("""
 input_article = "article.txt"
 output_dir = "output"
 
 [voices.main]
 # Missing ref_audio field
 ref_text = "test"
-"""
-        config_file.write_text(config_content)
-
-        with pytest.raises(ValueError, match="Missing 'ref_audio' for voice 'main'"):
-            ConfigManager.load_config(str(config_file))
+""")
 
     def test_get_default_config(self):
         """Test getting default configuration."""
@@ -201,18 +215,11 @@ ref_text = "test"
         assert main_voice.ref_text == ""
         assert main_voice.speed is None
 
-    def test_validate_config_valid(self, tmp_path):
+    def test_validate_config_valid(self, tmp_path, dummy_article, dummy_voice):
         """Test validating a valid configuration."""
-        # Create necessary files
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         # Create valid config
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir=str(tmp_path / "output"),
             max_sentence_length=200,
             model_name="F5-TTS",
@@ -223,7 +230,7 @@ ref_text = "test"
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -233,18 +240,15 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert errors == []
 
-    def test_validate_config_input_article_not_found(self, tmp_path):
+    def test_validate_config_input_article_not_found(self, dummy_voice):
         """Test validation when input article file doesn't exist."""
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         config = Config(
             input_article="nonexistent_article.txt",
             output_dir="output",
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -255,18 +259,15 @@ ref_text = "test"
         assert len(errors) == 1
         assert "Input article file not found" in errors[0]
 
-    def test_validate_config_input_article_empty(self, tmp_path):
+    def test_validate_config_input_article_empty(self, dummy_voice):
         """Test validation when input article path is empty."""
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         config = Config(
             input_article="",
             output_dir="output",
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -277,21 +278,18 @@ ref_text = "test"
         assert len(errors) == 1
         assert "input_article path is empty" in errors[0]
 
-    def test_validate_config_input_article_is_directory(self, tmp_path):
+    def test_validate_config_input_article_is_directory(self, tmp_path, dummy_voice):
         """Test validation when input article path is a directory."""
         article_dir = tmp_path / "article_dir"
         article_dir.mkdir()
 
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         config = Config(
             input_article=str(article_dir),
             output_dir="output",
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -302,21 +300,15 @@ ref_text = "test"
         assert len(errors) == 1
         assert "Input article path is not a file" in errors[0]
 
-    def test_validate_config_output_dir_empty(self, tmp_path):
+    def test_validate_config_output_dir_empty(self, dummy_article, dummy_voice):
         """Test validation when output_dir is empty."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="",
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -326,23 +318,17 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("output_dir path is empty" in e for e in errors)
 
-    def test_validate_config_invalid_max_sentence_length(self, tmp_path):
+    def test_validate_config_invalid_max_sentence_length(self, dummy_article, dummy_voice):
         """Test validation with invalid max_sentence_length values."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         # Test negative value
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             max_sentence_length=-10,
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -357,23 +343,17 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("max_sentence_length is too large" in e for e in errors)
 
-    def test_validate_config_invalid_speed(self, tmp_path):
+    def test_validate_config_invalid_speed(self, dummy_article, dummy_voice):
         """Test validation with invalid speed values."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         # Test negative speed
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             speed=-0.5,
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -388,13 +368,84 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("speed is too high" in e for e in errors)
 
-    def test_validate_config_no_voices(self, tmp_path):
-        """Test validation when no voices are configured."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
+    def test_load_and_validate_precision(self, tmp_path, dummy_article, dummy_voice):
+        """Test precision is loaded from config and validated."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(f'''
+input_article = "{dummy_article}"
+output_dir = "output"
+precision = "bf16"
+
+[voices.main]
+ref_audio = "{dummy_voice}"
+''')
+
+        config = ConfigManager.load_config(str(config_file))
+        assert config.precision == "bf16"
+        assert not any("precision" in e for e in ConfigManager.validate_config(config))
+
+        config.precision = "int4"
+        errors = ConfigManager.validate_config(config)
+        assert any("precision must be one of" in e for e in errors)
+
+    def test_validate_quantization(self, tmp_path, dummy_article, dummy_voice):
+        """Test quantization defaults to none and rejects unknown schemes."""
+        config = ConfigManager.loads(f'''
+input_article = "{dummy_article}"
+output_dir = "output"
+quantization = "int8"
+
+[voices.main]
+ref_audio = "{dummy_voice}"
+''')
+        assert config.quantization == "int8"
+        assert not any("quantization" in e for e in ConfigManager.validate_config(config))
 
+        config.quantization = "fp8"
+        errors = ConfigManager.validate_config(config)
+        assert any("quantization must be one of" in e for e in errors)
+
+    def test_load_config_compile_opt_in(self, tmp_path):
+        """Test that torch.compile is off by default and can be enabled."""
+        config_file = tmp_path / "config.toml"
+        base = 'input_article = "a.txt"\noutput_dir = "out"\n'
+        voices = '\n[voices.main]\nref_audio = "voice.wav"\n'
+        config_file.write_text(base + voices)
+        assert ConfigManager.load_config(str(config_file)).compile is False
+
+        config_file.write_text(base + "compile = true\n" + voices)
+        assert ConfigManager.load_config(str(config_file)).compile is True
+
+    def test_cache_threshold_validation(self):
+        """Test that step caching is off by default and rejects negative thresholds."""
+        base = 'input_article = "a.txt"\noutput_dir = "out"\n'
+        voices = '\n[voices.main]\nref_audio = "voice.wav"\n'
+        assert ConfigManager.loads(base + voices).cache_threshold == 0.0
+        config = ConfigManager.loads(base + "cache_threshold = 0.08\n" + voices)
+        assert config.cache_threshold == 0.08
+
+        config.cache_threshold = -0.1
+        errors = ConfigManager.validate_config(config, refresh=True)
+        assert "cache_threshold must be non-negative" in errors
+
+    def test_loads_cfg_cache(self):
+        """Test that CFG branch reuse is off by default and can be enabled."""
+        base = 'input_article = "a.txt"\noutput_dir = "out"\n'
+        voices = '\n[voices.main]\nref_audio = "voice.wav"\n'
+        assert ConfigManager.loads(base + voices).cfg_cache is False
+        assert ConfigManager.loads(base + "cfg_cache = true\n" + voices).cfg_cache is True
+
+    def test_loads_force_regenerate(self):
+        """Test that force_regenerate defaults to off and can be enabled."""
+        base = 'input_article = "a.txt"\noutput_dir = "out"\n'
+        voices = '\n[voices.main]\nref_audio = "voice.wav"\n'
+        assert ConfigManager.loads(base + voices).force_regenerate is False
+        assert ConfigManager.loads(base + "force_regenerate = true\n" + voices).force_regenerate is True
+
+    def test_validate_config_no_voices(self, dummy_article):
+        """Test validation when no voices are configured."""
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             voices={}
         )
@@ -402,13 +453,10 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("At least one voice must be configured" in e for e in errors)
 
-    def test_validate_config_voice_ref_audio_not_found(self, tmp_path):
+    def test_validate_config_voice_ref_audio_not_found(self, dummy_article):
         """Test validation when voice reference audio file doesn't exist."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             voices={
                 "main": VoiceConfig(
@@ -423,17 +471,14 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("Reference audio file not found" in e for e in errors)
 
-    def test_validate_config_voice_ref_audio_not_wav(self, tmp_path):
+    def test_validate_config_voice_ref_audio_not_wav(self, tmp_path, dummy_article):
         """Test validation when voice reference audio is not a WAV file."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
         # Create a non-WAV file
         audio_file = tmp_path / "voice.mp3"
         audio_file.write_text("dummy mp3")
 
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             voices={
                 "main": VoiceConfig(
@@ -448,22 +493,16 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("Reference audio must be a WAV file" in e for e in errors)
 
-    def test_validate_config_voice_invalid_speed(self, tmp_path):
+    def test_validate_config_voice_invalid_speed(self, dummy_article, dummy_voice):
         """Test validation with invalid voice-specific speed."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         # Test negative speed
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=-0.5
                 )
@@ -496,13 +535,10 @@ ref_text = "test"
         assert any("max_sentence_length must be positive" in e for e in errors)
         assert any("At least one voice must be configured" in e for e in errors)
 
-    def test_validate_config_voice_ref_audio_empty(self, tmp_path):
+    def test_validate_config_voice_ref_audio_empty(self, dummy_article):
         """Test validation when voice ref_audio is empty."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             voices={
                 "main": VoiceConfig(
@@ -517,16 +553,13 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("ref_audio path is empty" in e for e in errors)
 
-    def test_validate_config_voice_ref_audio_is_directory(self, tmp_path):
+    def test_validate_config_voice_ref_audio_is_directory(self, tmp_path, dummy_article):
         """Test validation when voice ref_audio is a directory."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
         audio_dir = tmp_path / "audio_dir"
         audio_dir.mkdir()
 
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             voices={
                 "main": VoiceConfig(
@@ -541,21 +574,15 @@ ref_text = "test"
         errors = ConfigManager.validate_config(config)
         assert any("Reference audio path is not a file" in e for e in errors)
 
-    def test_load_config_voice_with_all_fields(self, tmp_path):
+    def test_load_config_voice_with_all_fields(self, tmp_path, dummy_article, dummy_voice):
         """Test loading config with all voice fields specified."""
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
-
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
         config_file = tmp_path / "config.toml"
         config_content = f"""
-input_article = "{article_file}"
+input_article = "{dummy_article}"
 output_dir = "output"
 
 [voices.main]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 ref_text = "Complete reference text"
 speed = 1.5
 """
@@ -566,11 +593,11 @@ speed = 1.5
         assert len(config.voices) == 1
         main_voice = config.voices["main"]
         assert main_voice.name == "main"
-        assert main_voice.ref_audio == str(voice_file)
+        assert main_voice.ref_audio == str(dummy_voice)
         assert main_voice.ref_text == "Complete reference text"
         assert main_voice.speed == 1.5
 
-    def test_load_config_multiple_voices(self, tmp_path):
+    def test_load_config_multiple_voices(self, tmp_path, dummy_article):
         """Test loading config with multiple voices."""
         voice_file1 = tmp_path / "voice1.wav"
         voice_file1.write_text("dummy wav 1")
@@ -579,12 +606,9 @@ speed = 1.5
         voice_file3 = tmp_path / "voice3.wav"
         voice_file3.write_text("dummy wav 3")
 
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
         config_file = tmp_path / "config.toml"
         config_content = f"""
-input_article = "{article_file}"
+input_article = "{dummy_article}"
 output_dir = "output"
 
 [voices.main]
@@ -611,17 +635,11 @@ speed = 1.3
         assert config.voices["narrator"].ref_text == "Narrator voice"
         assert config.voices["character1"].speed == 1.3
 
-    def test_load_config_all_optional_fields(self, tmp_path):
+    def test_load_config_all_optional_fields(self, tmp_path, dummy_article, dummy_voice):
         """Test loading config with all optional fields specified."""
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
-
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
         config_file = tmp_path / "config.toml"
         config_content = f"""
-input_article = "{article_file}"
+input_article = "{dummy_article}"
 output_dir = "output"
 max_sentence_length = 150
 model_name = "F5TTS_Base"
@@ -631,14 +649,14 @@ speed = 1.5
 target_rms = 0.15
 
 [voices.main]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 ref_text = "Test"
 """
         config_file.write_text(config_content)
 
         config = ConfigManager.load_config(str(config_file))
 
-        assert config.input_article == str(article_file)
+        assert config.input_article == str(dummy_article)
         assert config.output_dir == "output"
         assert config.max_sentence_length == 150
         assert config.model_name == "F5TTS_Base"
@@ -647,17 +665,11 @@ ref_text = "Test"
         assert config.speed == 1.5
         assert config.target_rms == 0.15
 
-    def test_validate_config_boundary_values(self, tmp_path):
+    def test_validate_config_boundary_values(self, dummy_article, dummy_voice):
         """Test validation with boundary values for numeric parameters."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         # Test boundary values that should be valid
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             max_sentence_length=1,  # Minimum valid value
             nfe_step=1,  # Minimum valid value
@@ -667,7 +679,7 @@ ref_text = "Test"
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=0.01
                 )
@@ -689,23 +701,17 @@ ref_text = "Test"
         assert not any("too large" in e for e in errors)
         assert not any("too high" in e for e in errors)
 
-    def test_validate_config_zero_values(self, tmp_path):
+    def test_validate_config_zero_values(self, dummy_article, dummy_voice):
         """Test validation with zero values for numeric parameters."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         # Test zero values (should be invalid for most parameters)
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             max_sentence_length=0,
             voices={
                 "main": VoiceConfig(
                     name="main",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -727,43 +733,69 @@ ref_text = "Test"
         errors = ConfigManager.validate_config(config)
         assert any("nfe_step must be positive" in e for e in errors)
 
-    def test_load_config_with_comments_and_whitespace(self, tmp_path):
-        """Test loading config with comments and extra whitespace."""
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
+    def test_validate_config_rejects_non_finite_values(self, dummy_article, dummy_voice):
+        """Test NaN and infinite numeric values are reported, not silently accepted."""
+        config = Config(
+            input_article=str(dummy_article),
+            output_dir="output",
+            speed=float("nan"),
+            cfg_strength=float("inf"),
+            voices={"main": VoiceConfig(name="main", ref_audio=str(dummy_voice), speed=float("inf"))},
+        )
 
+        errors = ConfigManager.validate_config(config)
+        assert errors == [
+            "cfg_strength must be a finite number",
+            "speed must be a finite number",
+            "speed must be a finite number",
+        ]
+
+    def test_validate_config_caches_until_settings_change(self, tmp_path, dummy_voice):
+        """Test re-validation reuses the result until a checked field changes."""
         article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
+        config = Config(
+            input_article=str(article_file),
+            output_dir="output",
+            voices={"main": VoiceConfig(name="main", ref_audio=str(dummy_voice))},
+        )
+        assert len(ConfigManager.validate_config(config)) == 1
+
+        article_file.write_text("now present")
+        # Same settings: cached result, files are not re-checked
+        assert len(ConfigManager.validate_config(config)) == 1
+        assert ConfigManager.validate_config(config, refresh=True) == []
+
+        config.voices["main"].speed = 5.0
+        assert ConfigManager.validate_config(config) == ["speed is too high"]
 
+    def test_load_config_with_comments_and_whitespace(self, tmp_path, dummy_article, dummy_voice):
+        """Test loading config with comments and extra whitespace."""
         config_file = tmp_path / "config.toml"
         config_content = f"""
 # This is a comment
-input_article = "{article_file}"  # Inline comment
+input_article = "{dummy_article}"  # Inline comment
 
 # Another comment
 output_dir = "output"
 
 # Voice configuration
 [voices.main]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 ref_text = ""  # Empty reference text
 """
         config_file.write_text(config_content)
 
         # Should load successfully despite comments
         config = ConfigManager.load_config(str(config_file))
-        assert config.input_article == str(article_file)
+        assert config.input_article == str(dummy_article)
         assert config.output_dir == "output"
         assert "main" in config.voices
 
-    def test_load_config_voice_not_dict(self, tmp_path):
+    def test_load_config_voice_not_dict(self, tmp_path, dummy_article):
         """Test loading config when voice configuration is not a dictionary."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
         config_file = tmp_path / "config.toml"
         config_content = f"""
-input_article = "{article_file}"
+input_article = "{dummy_article}"
 output_dir = "output"
 
 [voices]
@@ -774,22 +806,16 @@ main = "not_a_dict"
         with pytest.raises(ValueError, match="Invalid voice configuration for 'main'"):
             ConfigManager.load_config(str(config_file))
 
-    def test_validate_config_empty_voice_name(self, tmp_path):
+    def test_validate_config_empty_voice_name(self, dummy_article, dummy_voice):
         """Test validation when voice name is empty."""
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test")
-
-        voice_file = tmp_path / "voice.wav"
-        voice_file.write_text("dummy wav")
-
         # Create config with empty voice name (using empty string as key)
         config = Config(
-            input_article=str(article_file),
+            input_article=str(dummy_article),
             output_dir="output",
             voices={
                 "": VoiceConfig(
                     name="",
-                    ref_audio=str(voice_file),
+                    ref_audio=str(dummy_voice),
                     ref_text="",
                     speed=None
                 )
@@ -799,14 +825,11 @@ main = "not_a_dict"
         errors = ConfigManager.validate_config(config)
         assert any("Voice name cannot be empty" in e for e in errors)
 
-    def test_voice_config_all_params(self, tmp_path):
+    def test_voice_config_all_params(self, dummy_voice):
         """Test VoiceConfig with all parameters."""
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
-
         voice = VoiceConfig(
             name="custom",
-            ref_audio=str(voice_file),
+            ref_audio=str(dummy_voice),
             ref_text="Reference text",
             speed=1.2,
             nfe_step=48,
@@ -815,7 +838,7 @@ main = "not_a_dict"
         )
 
         assert voice.name == "custom"
-        assert voice.ref_audio == str(voice_file)
+        assert voice.ref_audio == str(dummy_voice)
         assert voice.ref_text == "Reference text"
         assert voice.speed == 1.2
         assert voice.nfe_step == 48
@@ -832,31 +855,25 @@ main = "not_a_dict"
         assert voice.cfg_strength is None
         assert voice.target_rms is None
 
-    def test_load_config_voice_with_nfe_step_cfg_strength(self, tmp_path):
+    def test_load_config_voice_with_nfe_step_cfg_strength(self, tmp_path, dummy_article, dummy_voice):
         """Test loading config with voice-specific nfe_step and cfg_strength."""
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
-
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
         config_file = tmp_path / "config.toml"
         config_content = f"""
-input_article = "{article_file}"
+input_article = "{dummy_article}"
 output_dir = "output"
 nfe_step = 32
 cfg_strength = 2.0
 
 [voices.main]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 
 [voices.character1]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 nfe_step = 64
 cfg_strength = 3.0
 
 [voices.character2]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 nfe_step = 16
 cfg_strength = 1.5
 """
@@ -880,29 +897,23 @@ cfg_strength = 1.5
         assert config.voices["character2"].nfe_step == 16
         assert config.voices["character2"].cfg_strength == 1.5
 
-    def test_load_config_voice_with_target_rms(self, tmp_path):
+    def test_load_config_voice_with_target_rms(self, tmp_path, dummy_article, dummy_voice):
         """Test loading config with voice-specific target_rms."""
-        voice_file = tmp_path / "test_voice.wav"
-        voice_file.write_text("dummy wav content")
-
-        article_file = tmp_path / "article.txt"
-        article_file.write_text("Test article content")
-
         config_file = tmp_path / "config.toml"
         config_content = f"""
-input_article = "{article_file}"
+input_article = "{dummy_article}"
 output_dir = "output"
 target_rms = 0.1
 
 [voices.main]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 
 [voices.loud]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 target_rms = 0.18
 
 [voices.quiet]
-ref_audio = "{voice_file}"
+ref_audio = "{dummy_voice}"
 target_rms = 0.05
 """
         config_file.write_text(config_content)
@@ -0,0 +1,184 @@
+"""
+Tests for the sampling caches of the F5-TTS model (DiT step cache, CFG branch reuse).
+"""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+
+def _small_dit():
+    """A tiny CPU DiT with random weights (initialize_weights zeroes the AdaLN and output layers)."""
+    dit = pytest.importorskip("f5_tts.model.backbones.dit")
+    torch.manual_seed(0)
+    model = dit.DiT(dim=16, depth=2, heads=2, dim_head=8, dropout=0.0, mel_dim=4, text_num_embeds=10)
+    with torch.no_grad():
+        for p in model.parameters():
+            p.normal_(std=0.2)
+    return model.eval()
+
+
+def _full_forward(model, x, cond, text, time):
+    """The DiT forward pass with the whole block stack run, as before step caching."""
+    t = model.time_embed(time)
+    h = model.get_input_embed(x, cond, text, cache=False)
+    rope = model.rotary_embed.forward_from_seq_len(h.shape[1])
+    for block in model.transformer_blocks:
+        h = block(h, t, mask=None, rope=rope)
+    return model.proj_out(model.norm_out(h, t))
+
+
+def _block_stack_residual(model, x, cond, text, time):
+    t = model.time_embed(time)
+    h = model.get_input_embed(x, cond, text, cache=False)
+    rope = model.rotary_embed.forward_from_seq_len(h.shape[1])
+    out = h
+    for block in model.transformer_blocks:
+        out = block(out, t, mask=None, rope=rope)
+    return out - h
+
+
+class TestDiTStepCache:
+    """Tests for DiT.step_cache_threshold (TeaCache-style step skipping)."""
+
+    def _steps(self):
+        g = torch.Generator().manual_seed(1)
+        x = torch.randn(1, 6, 4, generator=g)
+        cond = torch.randn(1, 6, 4, generator=g)
+        text = torch.randint(0, 10, (1, 3), generator=g)
+        return cond, text, [(x * (1 - s) + s, torch.tensor([s])) for s in (0.0, 0.1, 0.2)]
+
+    def _count_block_calls(self, model):
+        calls = []
+        model.transformer_blocks[0].register_forward_hook(lambda *args: calls.append(1))
+        return calls
+
+    def test_threshold_zero_matches_full_forward(self):
+        """Test that with the cache off every step is the uncached forward pass, bit for bit."""
+        model = _small_dit()
+        cond, text, steps = self._steps()
+
+        with torch.no_grad():
+            for x, time in steps:
+                assert torch.equal(
+                    model(x=x, cond=cond, text=text, time=time), _full_forward(model, x, cond, text, time)
+                )
+        assert model._step_cache == {}
+
+    def test_reuse_step_applies_cached_residual(self):
+        """Test that a skipped step returns the output for x plus the residual of the last full pass."""
+        model = _small_dit()
+        model.step_cache_threshold = 1e9
+        cond, text, steps = self._steps()
+        (x1, t1), (x2, t2) = steps[:2]
+        calls = self._count_block_calls(model)
+
+        with torch.no_grad():
+            assert torch.equal(model(x=x1, cond=cond, text=text, time=t1), _full_forward(model, x1, cond, text, t1))
+            assert len(calls) == 1
+            out = model(x=x2, cond=cond, text=text, time=t2)
+            assert len(calls) == 1  # block stack skipped
+
+            residual = _block_stack_residual(model, x1, cond, text, t1)
+            t = model.time_embed(t2)
+            expected = model.proj_out(model.norm_out(model.get_input_embed(x2, cond, text, cache=False) + residual, t))
+        torch.testing.assert_close(out, expected)
+
+        model.clear_cache()
+        assert model._step_cache == {}
+
+    def test_cache_kept_per_batch_shape(self):
+        """Test that alternating packed CFG and cond-only passes each keep reusing their own cache."""
+        model = _small_dit()
+        model.step_cache_threshold = 1e9
+        cond, text, steps = self._steps()
+        calls = self._count_block_calls(model)
+
+        with torch.no_grad():
+            for x, time in steps:
+                model(x=x, cond=cond, text=text, time=time, cfg_infer=True)
+                model(x=x, cond=cond, text=text, time=time)
+        # Only the first pass of each shape runs the block stack
+        assert len(calls) == 2
+
+
+class _StubTransformer(torch.nn.Module):
+    """Stand-in for the DiT with closed-form cond / uncond outputs, recording each call."""
+
+    dim = 4
+
+    def __init__(self):
+        super().__init__()
+        self.weight = torch.nn.Parameter(torch.zeros(()))  # CFM reads its device and dtype off the parameters
+        self.calls = []
+
+    @staticmethod
+    def cond_out(x, t):
+        return x * 0.5 + t
+
+    @staticmethod
+    def uncond_out(x, t):
+        return -0.25 * x + 2 * t
+
+    def forward(
+        self, x, cond, text, time, mask=None, drop_audio_cond=False, drop_text=False, cfg_infer=False, cache=False
+    ):
+        if cfg_infer:
+            self.calls.append("full")
+            return torch.cat((self.cond_out(x, time), self.uncond_out(x, time)), dim=0)
+        self.calls.append("cond")
+        return self.cond_out(x, time)
+
+    def clear_cache(self):
+        pass
+
+
+class TestCFMBranchReuse:
+    """Tests for CFM.cfg_cache_interval (unconditional branch reuse)."""
+
+    CFG_STRENGTH = 2.0
+
+    def _sample(self, monkeypatch, interval, steps=6):
+        cfm = pytest.importorskip("f5_tts.model.cfm")
+        velocities = []
+
+        def euler(fn, y0, t, **kwargs):
+            ys = [y0]
+            for t0, t1 in zip(t[:-1], t[1:]):
+                v = fn(t0, ys[-1])
+                velocities.append((t0, ys[-1], v))
+                ys.append(ys[-1] + (t1 - t0) * v)
+            return torch.stack(ys)
+
+        monkeypatch.setattr(cfm, "odeint", euler)
+        transformer = _StubTransformer()
+        model = cfm.CFM(transformer, num_channels=4, mel_spec_module=torch.nn.Identity())
+        model.cfg_cache_interval = interval
+        cond = torch.randn(1, 5, 4, generator=torch.Generator().manual_seed(0))
+        text = torch.tensor([[1, 2, 3]])
+        model.sample(cond, text, 8, steps=steps, cfg_strength=self.CFG_STRENGTH, seed=0)
+        return transformer, velocities
+
+    def test_interval_zero_matches_full_cfg(self, monkeypatch):
+        """Test that with reuse off every step runs both branches and applies the usual CFG formula."""
+        transformer, velocities = self._sample(monkeypatch, interval=0)
+
+        assert transformer.calls == ["full"] * 6
+        for t, x, v in velocities:
+            pred, null_pred = transformer.cond_out(x, t), transformer.uncond_out(x, t)
+            assert torch.equal(v, pred + (pred - null_pred) * self.CFG_STRENGTH)
+
+    def test_reuse_steps_use_last_measured_gap(self, monkeypatch):
+        """Test that in-between steps run the cond branch only and subtract the last full step's gap."""
+        transformer, velocities = self._sample(monkeypatch, interval=3)
+
+        assert transformer.calls == ["full", "full", "cond", "full", "cond", "cond"]
+        gap = None
+        for kind, (t, x, v) in zip(transformer.calls, velocities):
+            pred = transformer.cond_out(x, t)
+            if kind == "full":
+                null_pred = transformer.uncond_out(x, t)
+                gap = null_pred - pred
+                torch.testing.assert_close(v, pred + (pred - null_pred) * self.CFG_STRENGTH)
+            else:
+                torch.testing.assert_close(v, pred - gap * self.CFG_STRENGTH)
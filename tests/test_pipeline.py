@@ -8,6 +8,7 @@ Tests the pipeline's ability to:
 - Work with config parameters (nfe_step, cfg_strength, speed, target_rms)
 """
 
+import dataclasses
 import os
 import tempfile
 from pathlib import Path
@@ -17,6 +18,7 @@ import pytest
 
 from src.tts_article.config import Config, VoiceConfig
 from src.tts_article.pipeline import GenerationPipeline, slugify_text, _get_ref_text
+from src.tts_article.splitter import SentenceSegment
 
 
 class TestSlugifyText:
@@ -46,6 +48,12 @@ class TestSlugifyText:
         # Empty result is acceptable - will use text content as-is
         assert isinstance(result, str)
 
+    def test_no_ascii_words_gives_empty_slug(self):
+        """Test that CJK-only or punctuation-only text yields an empty slug."""
+        assert slugify_text("这是中文，没有英文。") == ""
+        assert slugify_text(" !!! ") == ""
+        assert slugify_text("中文 abc 中文") == "abc"
+
 
 class TestGetRefText:
     """Tests for the _get_ref_text helper function."""
@@ -83,6 +91,17 @@ class TestGetRefText:
         # May read from project speech.txt if it exists, or be empty
         assert isinstance(ref_text, str)
 
+    def test_ref_text_file_read_once(self, tmp_path):
+        """Test that a companion .txt file is read once per reference clip."""
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+        (tmp_path / "voice.txt").write_text("File ref text")
+        voice_cfg = VoiceConfig(name="test", ref_audio=str(voice_file))
+
+        assert _get_ref_text(str(voice_file), voice_cfg) == "File ref text"
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            assert _get_ref_text(str(voice_file), voice_cfg) == "File ref text"
+
 
 class TestGenerationPipeline:
     """Test suite for GenerationPipeline class."""
@@ -164,6 +183,17 @@ class TestGenerationPipeline:
         path2 = pipeline._get_audio_path(audio_dir, None, "World")
         assert path1 != path2
 
+    def test_get_audio_path_slug_and_digest(self, tmp_path):
+        """Test that the file name carries a readable slug and a speed-sensitive digest."""
+        config = Config(input_article="test.txt", output_dir=str(tmp_path))
+        pipeline = GenerationPipeline(config)
+        audio_dir = tmp_path / "audio"
+
+        path = pipeline._get_audio_path(audio_dir, "main", "Hello, World!")
+        assert path.stem.startswith("main_hello_world_")
+        assert pipeline._get_audio_path(audio_dir, "main", "你好").stem.count("_") == 1
+        assert path != pipeline._get_audio_path(audio_dir, "main", "Hello, World!", speed=1.2)
+
 
 class TestPipelineIntegration:
     """Integration tests for the pipeline (without actual model)."""
@@ -206,11 +236,9 @@ class TestPipelineIntegration:
         voice_file = tmp_path / "voice.wav"
         voice_file.write_text("dummy")
 
-        # Mock TTS model
-        mock_tts = MagicMock()
-        mock_tts.infer = MagicMock(return_value=(None, 44100, None))
+        # Mock audio generator
         mock_audio_gen = MagicMock()
-        mock_audio_gen._tts = mock_tts
+        mock_audio_gen.infer_with_cached_ref = MagicMock(return_value=(None, 44100))
         mock_audio_gen_class.return_value = mock_audio_gen
 
         config = Config(
@@ -231,7 +259,7 @@ class TestPipelineIntegration:
             pass  # Expected - no real audio generated
 
         # Verify model was called
-        assert mock_tts.infer.called
+        assert mock_audio_gen.infer_with_cached_ref.called
 
     @patch('src.tts_article.pipeline.AudioGenerator')
     def test_run_multi_voice(self, mock_audio_gen_class, tmp_path):
@@ -248,11 +276,9 @@ This is a test.
         voice_file2 = tmp_path / "voice2.wav"
         voice_file2.write_text("dummy2")
 
-        # Mock TTS model
-        mock_tts = MagicMock()
-        mock_tts.infer = MagicMock(return_value=(None, 44100, None))
+        # Mock audio generator
         mock_audio_gen = MagicMock()
-        mock_audio_gen._tts = mock_tts
+        mock_audio_gen.infer_with_cached_ref = MagicMock(return_value=(None, 44100))
         mock_audio_gen_class.return_value = mock_audio_gen
 
         config = Config(
@@ -274,12 +300,107 @@ This is a test.
             pass
 
         # Verify model was called for both voices
-        assert mock_tts.infer.called
+        assert mock_audio_gen.infer_with_cached_ref.called
 
 
 class TestPipelineConcurrency:
     """Tests for concurrent generation features."""
 
+    def test_executor_reused_and_sized_by_cpu(self):
+        """Test that the executor persists across calls and never exceeds the CPU count on CPU-only hosts."""
+        import sys
+
+        config = Config(input_article="test.txt", output_dir="output")
+        pipeline = GenerationPipeline(config, workers=8)
+        with patch.dict(sys.modules, {"torch": None}), patch("os.cpu_count", return_value=2):
+            assert pipeline._auto_workers() == 2
+            executor = pipeline._get_executor()
+        assert pipeline._get_executor() is executor
+        assert executor._max_workers == 2
+
+    def test_workers_per_backend(self):
+        """Test that GPUs get one worker per loaded model, since a model runs one inference call at a time."""
+        pipeline = GenerationPipeline(Config(input_article="test.txt", output_dir="output"), workers=8)
+
+        pipeline._backend = "mps"
+        assert pipeline._auto_workers() == 1
+        pipeline._backend = "cuda"
+        pipeline._devices = [None]
+        assert pipeline._auto_workers() == 1
+        pipeline._devices = ["cuda:0", "cuda:1"]
+        assert pipeline._auto_workers() == 2
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_generation_sharded_across_gpus(self, mock_audio_gen_class, tmp_path):
+        """Test that each GPU gets its own initialized model replica with the references preprocessed."""
+        import threading
+
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("".join(f"[{'main' if i % 2 else 'alt'}]Line {i}.\n" for i in range(8)))
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+
+        gens = {}
+
+        def make_gen(config, device=None):
+            gen = MagicMock()
+            gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (np.zeros(2400, dtype=np.float32), 24000)
+            gens[device] = gen
+            return gen
+
+        mock_audio_gen_class.side_effect = make_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=1,
+            voices={
+                "main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref"),
+                "alt": VoiceConfig(name="alt", ref_audio=str(voice_file), ref_text="ref"),
+            },
+        )
+        pipeline = GenerationPipeline(config)
+        pipeline._devices = ["cuda:0", "cuda:1"]
+        # No CUDA here: only device assignment is under test
+        pipeline._backend = "cpu"
+        pipeline.run()
+
+        assert set(gens) == {"cuda:0", "cuda:1"}
+        assert sum(g.infer_with_cached_ref.call_count for g in gens.values()) == 8
+        assert all(g.initialize_model.called and g.preprocess_ref.called for g in gens.values())
+        # The I/O pool is shut down with the run
+        assert not any(t.name.startswith("tts-io") for t in threading.enumerate())
+
+    def test_gpu_lock_held_on_every_backend(self):
+        """Test that the model is never entered by two threads at once, and the lock survives errors."""
+        pipeline = GenerationPipeline(Config(input_article="test.txt", output_dir="output"))
+
+        for backend in ("mps", "cpu"):
+            pipeline._backend = backend
+            with pipeline._gpu_guard():
+                assert pipeline._model_lock().locked()
+            assert not pipeline._model_lock().locked()
+
+        with pytest.raises(RuntimeError):
+            with pipeline._gpu_guard():
+                raise RuntimeError("inference failed")
+        assert not pipeline._model_lock().locked()
+
+    def test_model_lock_per_device(self):
+        """Test that each GPU's model replica has its own inference lock."""
+        import threading
+
+        pipeline = GenerationPipeline(Config(input_article="test.txt", output_dir="output"))
+        pipeline._devices = ["cuda:0", "cuda:1"]
+        locks = []
+        for _ in range(2):
+            worker = threading.Thread(target=lambda: locks.append(pipeline._model_lock()))
+            worker.start()
+            worker.join()
+        assert locks[0] is not locks[1]
+
     @patch('src.tts_article.pipeline.AudioGenerator')
     def test_concurrent_execution(self, mock_audio_gen_class, tmp_path):
         """Test that concurrent execution works."""
@@ -293,12 +414,10 @@ class TestPipelineConcurrency:
 
         def mock_infer(*args, **kwargs):
             call_count["count"] += 1
-            return (None, 44100, None)
+            return (None, 44100)
 
-        mock_tts = MagicMock()
-        mock_tts.infer = mock_infer
         mock_audio_gen = MagicMock()
-        mock_audio_gen._tts = mock_tts
+        mock_audio_gen.infer_with_cached_ref = mock_infer
         mock_audio_gen_class.return_value = mock_audio_gen
 
         config = Config(
@@ -365,10 +484,8 @@ class TestPipelineConfigParameters:
         voice_file = tmp_path / "voice.wav"
         voice_file.write_text("dummy")
 
-        mock_tts = MagicMock()
-        mock_tts.infer = MagicMock(return_value=(None, 44100, None))
         mock_audio_gen = MagicMock()
-        mock_audio_gen._tts = mock_tts
+        mock_audio_gen.infer_with_cached_ref = MagicMock(return_value=(None, 44100))
         mock_audio_gen_class.return_value = mock_audio_gen
 
         config = Config(
@@ -388,7 +505,7 @@ class TestPipelineConfigParameters:
             pass
 
         # Verify nfe_step was passed correctly
-        call_kwargs = mock_tts.infer.call_args[1]
+        call_kwargs = mock_audio_gen.infer_with_cached_ref.call_args[1]
         assert call_kwargs.get("nfe_step") == 64
 
     @patch('src.tts_article.pipeline.AudioGenerator')
@@ -399,10 +516,8 @@ class TestPipelineConfigParameters:
         voice_file = tmp_path / "voice.wav"
         voice_file.write_text("dummy")
 
-        mock_tts = MagicMock()
-        mock_tts.infer = MagicMock(return_value=(None, 44100, None))
         mock_audio_gen = MagicMock()
-        mock_audio_gen._tts = mock_tts
+        mock_audio_gen.infer_with_cached_ref = MagicMock(return_value=(None, 44100))
         mock_audio_gen_class.return_value = mock_audio_gen
 
         config = Config(
@@ -421,7 +536,7 @@ class TestPipelineConfigParameters:
         except Exception:
             pass
 
-        call_kwargs = mock_tts.infer.call_args[1]
+        call_kwargs = mock_audio_gen.infer_with_cached_ref.call_args[1]
         assert call_kwargs.get("cfg_strength") == 3.0
 
     @patch('src.tts_article.pipeline.AudioGenerator')
@@ -432,10 +547,8 @@ class TestPipelineConfigParameters:
         voice_file = tmp_path / "voice.wav"
         voice_file.write_text("dummy")
 
-        mock_tts = MagicMock()
-        mock_tts.infer = MagicMock(return_value=(None, 44100, None))
         mock_audio_gen = MagicMock()
-        mock_audio_gen._tts = mock_tts
+        mock_audio_gen.infer_with_cached_ref = MagicMock(return_value=(None, 44100))
         mock_audio_gen_class.return_value = mock_audio_gen
 
         config = Config(
@@ -454,5 +567,579 @@ class TestPipelineConfigParameters:
         except Exception:
             pass
 
-        call_kwargs = mock_tts.infer.call_args[1]
+        call_kwargs = mock_audio_gen.infer_with_cached_ref.call_args[1]
         assert call_kwargs.get("target_rms") == 0.15
+
+
+class TestPipelineBatching:
+    """Tests for batched generation of same-voice segments."""
+
+    @staticmethod
+    def _mock_audio_gen(mock_audio_gen_class):
+        import numpy as np
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen.infer_batch.side_effect = lambda ref_audio, ref_text, gen_texts, **kw: [
+            (np.zeros(2400, dtype=np.float32), 24000) for _ in gen_texts
+        ]
+        mock_audio_gen_class.return_value = mock_audio_gen
+        return mock_audio_gen
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_same_voice_segments_share_one_batch(self, mock_audio_gen_class, tmp_path):
+        """Test that segments of one voice are generated with a single batched call."""
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("First line.\nSecond line.\nThird line.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+        mock_audio_gen = self._mock_audio_gen(mock_audio_gen_class)
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            nfe_step=48,
+            batch_size=4,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config).run()
+
+        assert mock_audio_gen.infer_batch.call_count == 1
+        args, kwargs = mock_audio_gen.infer_batch.call_args
+        assert args[2] == ["First line.", "Second line.", "Third line."]
+        assert kwargs["nfe_step"] == 48
+        assert not mock_audio_gen.infer_with_cached_ref.called
+        assert len(list((tmp_path / "audio").glob("*.wav"))) == 3
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_batch_size_splits_groups(self, mock_audio_gen_class, tmp_path):
+        """Test that a voice group larger than batch_size is split into several calls."""
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("One.\nTwo.\nThree.\nFour.\nFive.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+        mock_audio_gen = self._mock_audio_gen(mock_audio_gen_class)
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=2,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config).run()
+
+        # Groups of 2 + 2 batched, the trailing single segment uses the regular path
+        assert mock_audio_gen.infer_batch.call_count == 2
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 1
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_batch_size_one_generates_per_segment(self, mock_audio_gen_class, tmp_path):
+        """Test that batch_size=1 keeps one infer call per segment."""
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("First line.\nSecond line.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+        mock_audio_gen = self._mock_audio_gen(mock_audio_gen_class)
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=1,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config).run()
+
+        assert not mock_audio_gen.infer_batch.called
+        assert mock_audio_gen.infer_with_cached_ref.called
+
+    def test_batches_group_similar_lengths(self):
+        """Test that each voice group is chunked by input length, keeping article order per batch."""
+        texts = ["a" * 30, "b" * 2, "c" * 28, "d" * 3]
+        segments = [SentenceSegment(index=i, text=t, voice_name="main") for i, t in enumerate(texts)]
+        prepped = {seg.index: seg.text for seg in segments}
+
+        batches = GenerationPipeline._group_batches(segments, 2, prepped)
+
+        assert [[seg.index for seg in batch] for batch in batches] == [[1, 3], [0, 2]]
+        # Without prepped text the groups are chunked in article order
+        assert [[seg.index for seg in batch] for batch in GenerationPipeline._group_batches(segments, 2)] == [[0, 1], [2, 3]]
+
+
+class TestPipelineRefCache:
+    """Tests for reusing preprocessed reference audio."""
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_reference_preprocessed_once_per_voice(self, mock_audio_gen_class, tmp_path):
+        """Test that each voice reference is preprocessed once, not per segment."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("One.\nTwo.\nThree.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=1,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config, workers=1).run()
+
+        assert mock_audio_gen.preprocess_ref.call_count == 1
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 3
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_reference_encoded_once_per_voice_batched(self, mock_audio_gen_class, tmp_path):
+        """Test that a 10-segment two-voice article encodes each reference once and releases it after the run."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("".join(f"[{'main' if i % 2 else 'alt'}]Line {i}.\n" for i in range(10)))
+        main_file = tmp_path / "main.wav"
+        main_file.write_text("dummy")
+        alt_file = tmp_path / "alt.wav"
+        alt_file.write_text("dummy")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_batch.side_effect = lambda ref_audio, ref_text, gen_texts, **kw: [
+            (np.zeros(2400, dtype=np.float32), 24000) for _ in gen_texts
+        ]
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=8,
+            voices={
+                "main": VoiceConfig(name="main", ref_audio=str(main_file), ref_text="ref"),
+                "alt": VoiceConfig(name="alt", ref_audio=str(alt_file), ref_text="ref"),
+            },
+        )
+        GenerationPipeline(config).run()
+
+        refs = sorted(c.args[0] for c in mock_audio_gen.preprocess_ref.call_args_list)
+        assert refs == sorted([str(main_file), str(alt_file)])
+        assert mock_audio_gen.infer_batch.call_count == 2
+        mock_audio_gen.clear_ref_cache.assert_called_once()
+
+    @patch('src.tts_article.pipeline._prefetch_file')
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_reference_audio_prefetched(self, mock_audio_gen_class, mock_prefetch, tmp_path):
+        """Test that every reference clip in use is prefetched during the run."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("[alt]One.\n")
+        main_file = tmp_path / "main.wav"
+        main_file.write_text("dummy")
+        alt_file = tmp_path / "alt.wav"
+        alt_file.write_text("dummy")
+        unused_file = tmp_path / "unused.wav"
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            voices={
+                "main": VoiceConfig(name="main", ref_audio=str(main_file)),
+                "alt": VoiceConfig(name="alt", ref_audio=str(alt_file)),
+                "unused": VoiceConfig(name="unused", ref_audio=str(unused_file)),
+            },
+        )
+        GenerationPipeline(config).run()
+
+        assert sorted(c.args[0] for c in mock_prefetch.call_args_list) == sorted([str(main_file), str(alt_file)])
+
+    def test_prefetch_file_ignores_missing_file(self, tmp_path):
+        """Test that prefetching is best effort."""
+        from src.tts_article.pipeline import _prefetch_file
+
+        _prefetch_file(str(tmp_path / "missing.wav"))
+        existing = tmp_path / "voice.wav"
+        existing.write_bytes(b"RIFF")
+        _prefetch_file(str(existing))
+
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_ref_text_reloaded_per_run(self, mock_audio_gen_class, tmp_path):
+        """Test that an edited companion .txt file is picked up by the next run."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("One.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+        txt_file = tmp_path / "voice.txt"
+        txt_file.write_text("first")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file))}
+        )
+        pipeline = GenerationPipeline(config, workers=1)
+        pipeline.run()
+        txt_file.write_text("second")
+        pipeline.run()
+
+        assert [c.args[1] for c in mock_audio_gen.preprocess_ref.call_args_list] == ["first", "second"]
+
+class TestPipelineTextPreparation:
+    """Tests for up-front text preparation."""
+
+    def test_polyphone_longest_match_wins(self):
+        """Test that overlapping polyphone keys prefer the longest word."""
+        config = Config(
+            input_article="test.txt",
+            output_dir="output",
+            polyphone_dict={"好": "号", "偏好": "偏浩"},
+        )
+        pipeline = GenerationPipeline(config)
+        assert pipeline._apply_polyphone_replacements("我偏好你好") == "我偏浩你号"
+
+    def test_no_polyphone_dict_leaves_text(self):
+        """Test that text is untouched without a polyphone_dict."""
+        pipeline = GenerationPipeline(Config(input_article="test.txt", output_dir="output"))
+        assert pipeline._apply_polyphone_replacements("偏好") == "偏好"
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_prepared_text_passed_to_infer(self, mock_audio_gen_class, tmp_path):
+        """Test that the model receives the polyphone- and numeral-converted text."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("偏好3个。")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            polyphone_dict={"偏好": "偏浩"},
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config, workers=1).run()
+
+        assert mock_audio_gen.infer_with_cached_ref.call_args[0][2] == "偏浩三个。"
+
+
+class TestPipelineStitching:
+    """Tests for raw PCM concatenation of segment WAVs."""
+
+    def test_stitch_wavs_inserts_gap(self, tmp_path):
+        """Test that frames are concatenated and gaps are zero-filled."""
+        import wave
+
+        import numpy as np
+        import soundfile as sf
+
+        p1, p2 = tmp_path / "a.wav", tmp_path / "b.wav"
+        sf.write(p1, np.full(2400, 0.5, dtype=np.float32), 24000, subtype="PCM_16")
+        sf.write(p2, np.full(4800, 0.25, dtype=np.float32), 24000, subtype="PCM_16")
+        out = tmp_path / "out.wav"
+
+        durations = GenerationPipeline._stitch_wavs([str(p1), str(p2)], {1}, str(out))
+
+        assert durations == [0.1, 0.2]
+        with wave.open(str(out), "rb") as w:
+            assert w.getframerate() == 24000
+            assert w.getnframes() == 2400 + 4800 + 4800  # 200ms gap at 24kHz
+        data, _ = sf.read(out)
+        assert np.all(data[2400:7200] == 0)
+
+    def test_stitch_wavs_converts_mismatched_format(self, tmp_path):
+        """Test that inputs with a different sample rate are converted to the first file's format."""
+        import wave
+
+        import numpy as np
+        import soundfile as sf
+
+        p1, p2 = tmp_path / "a.wav", tmp_path / "b.wav"
+        sf.write(p1, np.zeros(2400, dtype=np.float32), 24000, subtype="PCM_16")
+        sf.write(p2, np.zeros(4800, dtype=np.float32), 48000, subtype="PCM_16")
+        out = tmp_path / "out.wav"
+
+        durations = GenerationPipeline._stitch_wavs([str(p1), str(p2)], set(), str(out))
+
+        assert durations == [0.1, 0.1]
+        with wave.open(str(out), "rb") as w:
+            assert w.getnframes() == 4800
+
+
+class TestPipelinePostprocess:
+    """Tests for the per-segment silence tail and fade."""
+
+    def test_postprocess_appends_tail_and_fades(self, tmp_path):
+        """Test that 150ms of silence is appended and the speech tail fades to zero."""
+        import numpy as np
+        import soundfile as sf
+
+        path = tmp_path / "seg.wav"
+        sf.write(path, np.full(2400, 0.5, dtype=np.float32), 24000, subtype="PCM_16")
+        pipeline = GenerationPipeline(Config(input_article="test.txt", output_dir=str(tmp_path)))
+
+        duration = pipeline._postprocess_audio(str(path))
+
+        data, sr = sf.read(path, dtype="int16")
+        assert sr == 24000
+        assert len(data) == 2400 + 3600
+        assert duration == len(data) / sr
+        assert data[0] == data[2400 - 721]  # before the 30ms fade window
+        assert abs(int(data[2399])) <= 1
+        assert np.all(data[2400:] == 0)
+
+    def test_write_segment_audio_is_atomic(self, tmp_path):
+        """Test that a failed write leaves neither the cache entry nor a temp file behind."""
+        import numpy as np
+
+        pipeline = GenerationPipeline(Config(input_article="test.txt", output_dir=str(tmp_path)))
+        target = tmp_path / "seg.wav"
+
+        with patch("soundfile.write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                pipeline._write_segment_audio(target, np.zeros(2400, dtype=np.float32), 24000)
+        assert list(tmp_path.iterdir()) == []
+
+        duration = pipeline._write_segment_audio(target, np.zeros(2400, dtype=np.float32), 24000)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["seg.done", "seg.wav"]
+        assert duration == pytest.approx(0.25)
+
+
+class TestPipelineLogging:
+    """Tests for progress logging."""
+
+    def test_progress_logged_per_ten_percent(self, caplog):
+        """Test that progress is logged once per 10% step rather than per segment."""
+        import logging
+
+        with caplog.at_level(logging.INFO, logger="tts_article"):
+            for i in range(1, 101):
+                GenerationPipeline._log_progress(i, 100)
+        assert len(caplog.records) == 10
+        assert caplog.records[-1].getMessage() == "Progress: 100/100 (100%)"
+
+    def test_progress_batched_steps(self, caplog):
+        """Test that batched progress crossing a 10% boundary is logged."""
+        import logging
+
+        with caplog.at_level(logging.INFO, logger="tts_article"):
+            GenerationPipeline._log_progress(4, 40, 4)
+            GenerationPipeline._log_progress(6, 40, 2)
+        assert [r.getMessage() for r in caplog.records] == ["Progress: 4/40 (10%)"]
+
+    def test_progress_bar_only_on_terminal(self, caplog):
+        """Test that a tqdm bar is used on an interactive terminal and log lines otherwise."""
+        import logging
+
+        with caplog.at_level(logging.WARNING, logger="tts_article"), patch("sys.stderr.isatty", return_value=True):
+            assert GenerationPipeline._progress_bar(10) is None
+        with caplog.at_level(logging.INFO, logger="tts_article"):
+            with patch("sys.stderr.isatty", return_value=False):
+                assert GenerationPipeline._progress_bar(10) is None
+            pytest.importorskip("tqdm")
+            with patch("sys.stderr.isatty", return_value=True):
+                bar = GenerationPipeline._progress_bar(10)
+            assert bar.total == 10
+            bar.close()
+
+
+class TestPipelineVoiceTable:
+    """Tests for per-voice parameter resolution."""
+
+    def test_voice_overrides_resolved_once(self):
+        """Test that voice-level overrides and global fallbacks land in the voice table."""
+        config = Config(
+            input_article="test.txt",
+            output_dir="output",
+            nfe_step=32,
+            cfg_strength=2.0,
+            voices={
+                "main": VoiceConfig(name="main", ref_audio="main.wav"),
+                "vivian": VoiceConfig(name="vivian", ref_audio="vivian.wav", nfe_step=64),
+            },
+        )
+        pipeline = GenerationPipeline(config)
+        voice_ids = pipeline._build_voice_table({
+            "main": ("main.wav", "main ref", 1.0),
+            "vivian": ("vivian.wav", "vivian ref", 1.2),
+        })
+
+        seg = SentenceSegment(index=0, text="Hi", voice_name="vivian", speed=None)
+        ref_audio, ref_text, params = pipeline._segment_params(seg, voice_ids["vivian"])
+        assert (ref_audio, ref_text) == ("vivian.wav", "vivian ref")
+        assert params["speed"] == 1.2
+        assert params["nfe_step"] == 64
+        assert params["cfg_strength"] == 2.0
+
+        seg = dataclasses.replace(seg, speed=0.8)
+        assert pipeline._segment_params(seg, voice_ids["main"])[2]["speed"] == 0.8
+
+
+class TestPipelineBackgroundIO:
+    """Tests for writing segment audio off the inference thread."""
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_duplicate_segment_reuses_pending_write(self, mock_audio_gen_class, tmp_path):
+        """Test that a repeated segment waits on the in-flight write instead of regenerating."""
+        import json
+
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("Same.\nSame.\nOther.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=1,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config, workers=1).run()
+
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 2
+        assert len(list((tmp_path / "audio").glob("*.wav"))) == 2
+        metadata = json.loads((tmp_path / "metadata.json").read_text())
+        assert [s["duration"] for s in metadata["segments"]] == [0.25, 0.25, 0.25]
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_cache_hit_is_not_post_processed_again(self, mock_audio_gen_class, tmp_path):
+        """Test that a second run reuses cached audio without regenerating or growing it."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("First line.\nSecond line.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=1,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config, workers=1).run()
+        sizes = {p.name: p.stat().st_size for p in (tmp_path / "audio").glob("*.wav")}
+        GenerationPipeline(config, workers=1).run()
+
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 2
+        assert {p.name: p.stat().st_size for p in (tmp_path / "audio").glob("*.wav")} == sizes
+
+        config.force_regenerate = True
+        GenerationPipeline(config, workers=1).run()
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 4
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_cache_misses_when_generation_inputs_change(self, mock_audio_gen_class, tmp_path):
+        """Test that changed parameters, a re-recorded reference or new polyphone rules regenerate the audio."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("偏好一句话。\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=1,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config, workers=1).run()
+        GenerationPipeline(config, workers=1).run()
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 1
+
+        config.nfe_step = 16
+        GenerationPipeline(config, workers=1).run()
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 2
+
+        st = voice_file.stat()
+        os.utime(voice_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        GenerationPipeline(config, workers=1).run()
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 3
+
+        config.voices["main"].ref_text = "other ref"
+        GenerationPipeline(config, workers=1).run()
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 4
+
+        config.polyphone_dict = {"偏好": "偏浩"}
+        GenerationPipeline(config, workers=1).run()
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 5
+
+        config.cfg_cache = True
+        GenerationPipeline(config, workers=1).run()
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 6
+
+    @patch('src.tts_article.pipeline.AudioGenerator')
+    def test_audio_without_done_marker_is_regenerated(self, mock_audio_gen_class, tmp_path):
+        """Test that a cache file lacking its .done marker is treated as incomplete."""
+        import numpy as np
+
+        article_file = tmp_path / "article.txt"
+        article_file.write_text("Only line.\n")
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+
+        mock_audio_gen = MagicMock()
+        mock_audio_gen.infer_with_cached_ref.side_effect = lambda *args, **kw: (
+            np.zeros(2400, dtype=np.float32), 24000
+        )
+        mock_audio_gen_class.return_value = mock_audio_gen
+
+        config = Config(
+            input_article=str(article_file),
+            output_dir=str(tmp_path),
+            batch_size=1,
+            voices={"main": VoiceConfig(name="main", ref_audio=str(voice_file), ref_text="ref")}
+        )
+        GenerationPipeline(config, workers=1).run()
+        for marker in (tmp_path / "audio").glob("*.done"):
+            marker.unlink()
+        GenerationPipeline(config, workers=1).run()
+
+        assert mock_audio_gen.infer_with_cached_ref.call_count == 2
@@ -102,6 +102,33 @@ class TestArticleSplitter:
         for seg in result:
             assert len(seg.text) <= splitter.max_length
 
+    def test_split_by_punctuation_keeps_terminators(self):
+        """Test punctuation stays attached to the piece it ends."""
+        splitter = ArticleSplitter()
+        result = splitter._split_by_punctuation("你好。。世界！ ok, fine. 再见")
+        assert result == ["你好。", "。", "世界！", "ok,", "fine.", "再见"]
+
+    def test_split_long_word_after_nbsp(self):
+        """Test that pieces ending in whitespace are trimmed rather than rejected."""
+        segments = ArticleSplitter(max_length=5).split("aaaa\xa0bbbbbbb")
+        assert [seg.text for seg in segments] == ["aaaa", "bbbbb", "bb"]
+
+    def test_split_long_segment_at_nbsp(self):
+        """Test that non-breaking and other Unicode spaces are word boundaries, not hard-split."""
+        splitter = ArticleSplitter(max_length=9)
+        assert [seg.text for seg in splitter.split("word\xa0word\xa0word\xa0word")] == ["word word", "word word"]
+        assert splitter._split_long_segment("ab\u2009cd\u202fefgh") == ["ab cd", "efgh"]
+
+    def test_hard_split_strips_slices(self):
+        """Test that hard-split slices never start or end with whitespace."""
+        splitter = ArticleSplitter(max_length=4)
+        assert splitter._hard_split("abc\xa0defg\u2009 \u2009\u2009h") == ["abc", "defg", "h"]
+
+    def test_comma_split_keeps_whitespace_before_comma(self):
+        """Test that only whitespace after a comma is consumed, so the piece before it still counts it."""
+        splitter = ArticleSplitter(max_length=5)
+        assert splitter._split_long_segment("a\u3000a \xa0 ,") == ["a a"]
+
     def test_split_with_voice_markers(self):
         """Test splitting text with [voice] markers."""
         splitter = ArticleSplitter()
@@ -115,6 +142,38 @@ class TestArticleSplitter:
         assert "main" in voices
         assert "vivian" in voices
 
+    def test_parse_voice_markers_returns_trimmed_spans(self):
+        """Test voice marker parsing yields trimmed offsets into the text."""
+        splitter = ArticleSplitter()
+        text = "开头 [vivian]  你好 \n[main]"
+        spans = splitter._parse_voice_markers(text)
+        assert [(v, text[s:e]) for v, s, e in spans] == [("main", "开头"), ("vivian", "你好")]
+
+    def test_iter_split_matches_split(self):
+        """Test the lazy splitter yields the same segments as split()."""
+        splitter = ArticleSplitter(max_length=10)
+        text = "[main]第一行\n[vivian]这是一个非常长的句子，超过了最大长度限制。"
+        segments = splitter.iter_split(text)
+        assert next(segments) == SentenceSegment(index=0, text="第一行", voice_name="main")
+        assert list(segments) == splitter.split(text)[1:]
+
+    def test_split_parallel_matches_split(self):
+        """Test that process-parallel splitting yields the same segments as split()."""
+        article = "[main]第一段，很长的一句话。\n\n第二行\n[vivian]另一个声音的文本，也需要切分。\n" * 50
+        splitter = ArticleSplitter(max_length=8)
+        with patch("src.tts_article.splitter._PARALLEL_MIN_CHARS", 0):
+            assert splitter.split_parallel(article, workers=2) == splitter.split(article)
+
+    def test_split_reuses_cached_segments(self):
+        """Test re-splitting the same article reuses the cached segments."""
+        text = "[main]缓存测试。\n[vivian]第二句。"
+        first = ArticleSplitter(max_length=50).split(text)
+        with patch.object(ArticleSplitter, "iter_split") as mock_iter:
+            second = ArticleSplitter(max_length=50).split(text)
+        mock_iter.assert_not_called()
+        assert second == first and second is not first
+        assert all(a is b for a, b in zip(first, second))
+
     def test_split_voice_marker_empty_content(self):
         """Test voice marker with empty following content."""
         splitter = ArticleSplitter()
@@ -170,6 +229,29 @@ class TestArticleSplitter:
         result = splitter.split(text)
         assert len(result) >= 2
 
+    def test_split_json_blocks_skips_invalid_json(self):
+        """Test that a non-JSON brace block ends the previous block and is dropped."""
+        splitter = ArticleSplitter()
+        text = '{"name": "main"} 第一段 {not json} 丢弃 {"name": "vivian", "speed": 1.2} 第二段'
+        blocks = splitter._split_by_json_blocks(text)
+        assert blocks == [("main", "第一段", None), ("vivian", "第二段", 1.2)]
+
+    def test_parse_json_block_matches_json_loads(self):
+        """Test the flat-block fast path agrees with json.loads, including rejections."""
+        import json
+        for raw in [
+            '{"name": "f-a/happy", "seed": -1, "speed": 1}',
+            '{"name":"a","speed":1.5e0,"x":null,"y":true}',
+            '{"name": "a\\"b"}',
+            '{"name": "x",}',
+            '{ "n" : 01 }',
+        ]:
+            try:
+                expected = json.loads(raw)
+            except ValueError:
+                expected = None
+            assert ArticleSplitter._parse_json_block(raw) == expected
+
     def test_split_preserves_line_breaks(self):
         """Test that line breaks are respected."""
         splitter = ArticleSplitter()
@@ -276,6 +358,110 @@ class TestFileConcatenator:
                 pass
 
 
+    @patch('src.tts_article.concatenator.AudioSegment')
+    def test_concatenate_single_wav_copies_bytes(self, mock_audio_segment, tmp_path):
+        """Test that a single WAV input is copied as-is without decoding."""
+        from src.tts_article.concatenator import FileConcatenator
+
+        src = tmp_path / "only.wav"
+        src.write_bytes(b"RIFF....WAVEdata")
+        output = str(tmp_path / "output.wav")
+
+        assert FileConcatenator().concatenate_audio([str(src)], output) == output
+        assert Path(output).read_bytes() == src.read_bytes()
+        assert not mock_audio_segment.from_file.called
+
+    def test_concatenate_crossfades_pcm(self, tmp_path):
+        """Test that same-format files are crossfaded into one buffer of the expected length."""
+        import numpy as np
+        import soundfile as sf
+        from src.tts_article.concatenator import FileConcatenator
+
+        sr = 1000
+        paths = []
+        for i, value in enumerate((0.5, -0.5, 0.25)):
+            p = tmp_path / f"file{i}.wav"
+            sf.write(p, np.full(500, value, dtype=np.float32), sr, subtype="FLOAT")
+            paths.append(str(p))
+
+        output = str(tmp_path / "output.wav")
+        assert FileConcatenator().concatenate_audio(paths, output, cross_fade_duration=0.1) == output
+
+        data, out_sr = sf.read(output, dtype="float32")
+        assert out_sr == sr
+        assert sf.info(output).subtype == "FLOAT"
+        assert len(data) == 3 * 500 - 2 * 100
+        assert data[0] == 0.5 and data[600] == -0.5 and data[-1] == 0.25
+        # Linear ramp from the first file into the second across the overlap
+        np.testing.assert_allclose(data[400:500], np.linspace(0.5, -0.5, 100), atol=1e-6)
+
+    @patch('src.tts_article.concatenator.AudioSegment')
+    def test_concatenate_mixed_channels_without_pydub(self, mock_audio_segment, tmp_path):
+        """Test that WAVs differing only in channel count are joined via soundfile."""
+        import numpy as np
+        import soundfile as sf
+        from src.tts_article.concatenator import FileConcatenator
+
+        stereo = tmp_path / "stereo.wav"
+        sf.write(stereo, np.full((300, 2), 0.5, dtype=np.float32), 1000, subtype="FLOAT")
+        mono = tmp_path / "mono.wav"
+        sf.write(mono, np.full(300, -0.25, dtype=np.float32), 1000, subtype="FLOAT")
+
+        output = str(tmp_path / "output.wav")
+        FileConcatenator().concatenate_audio([str(stereo), str(mono)], output, cross_fade_duration=0.0)
+
+        data, _ = sf.read(output, dtype="float32", always_2d=True)
+        assert data.shape == (600, 2)
+        assert (data[300:] == -0.25).all()
+        assert not mock_audio_segment.from_file.called
+
+    def test_concatenate_mono_first_keeps_stereo(self, tmp_path):
+        """Test that the output takes the widest input's channel count, not the first file's."""
+        import numpy as np
+        import soundfile as sf
+        from src.tts_article.concatenator import FileConcatenator
+
+        paths = []
+        for name, data in (
+            ("a", np.full(200, 0.25, dtype=np.float32)),
+            ("b", np.full(200, -0.25, dtype=np.float32)),
+            ("c", np.stack([np.full(200, 0.5), np.full(200, -0.5)], axis=1).astype(np.float32)),
+        ):
+            p = tmp_path / f"{name}.wav"
+            sf.write(p, data, 1000, subtype="FLOAT")
+            paths.append(str(p))
+
+        output = str(tmp_path / "output.wav")
+        FileConcatenator().concatenate_audio(paths, output, cross_fade_duration=0.0)
+
+        data, _ = sf.read(output, dtype="float32", always_2d=True)
+        assert data.shape == (600, 2)
+        assert (data[:200] == 0.25).all()
+        assert (data[400:, 0] == 0.5).all() and (data[400:, 1] == -0.5).all()
+
+    @patch('src.tts_article.concatenator._decode_av')
+    @patch('src.tts_article.concatenator._av')
+    @patch('src.tts_article.concatenator.AudioSegment')
+    def test_concatenate_mixed_rates_uses_pyav(self, mock_audio_segment, mock_av, mock_decode_av, tmp_path):
+        """Test that a file at another sample rate is decoded in-process by PyAV when it is installed."""
+        import numpy as np
+        import soundfile as sf
+        from src.tts_article.concatenator import FileConcatenator
+
+        first = tmp_path / "first.wav"
+        sf.write(first, np.zeros(100, dtype=np.float32), 1000)
+        other = tmp_path / "other.wav"
+        sf.write(other, np.zeros(200, dtype=np.float32), 2000)
+        mock_decode_av.return_value = np.ones((100, 1), dtype=np.float32)
+
+        output = str(tmp_path / "output.wav")
+        FileConcatenator().concatenate_audio([str(first), str(other)], output, cross_fade_duration=0.0)
+
+        mock_decode_av.assert_called_once_with(str(other), 1000, 1)
+        assert sf.info(output).frames == 200
+        assert not mock_audio_segment.from_file.called
+
+
 # ============================================================
 # Tests for AudioGenerator
 # ============================================================
@@ -377,6 +563,102 @@ class TestAudioGenerator:
             # If it fails due to audio processing, that's OK for this test
             pytest.skip(f"Audio processing not available: {e}")
 
+    def test_preprocess_ref_reloads_modified_clip(self, tmp_path):
+        """Test that the reference cache is keyed by the clip's mtime."""
+        import sys
+
+        voice_file = tmp_path / "voice.wav"
+        voice_file.write_text("dummy")
+        utils_infer = MagicMock()
+        utils_infer.preprocess_ref_audio_text.return_value = (str(voice_file), "ref")
+        torchaudio = MagicMock()
+        torchaudio.load.return_value = ("audio", 24000)
+        gen = AudioGenerator(Config(input_article="test.txt", output_dir=str(tmp_path)))
+
+        with patch.dict(sys.modules, {
+            "torchaudio": torchaudio,
+            "f5_tts": MagicMock(),
+            "f5_tts.infer": MagicMock(),
+            "f5_tts.infer.utils_infer": utils_infer,
+        }):
+            gen.preprocess_ref(str(voice_file), "ref")
+            gen.preprocess_ref(str(voice_file), "ref")
+            assert utils_infer.preprocess_ref_audio_text.call_count == 1
+            stat = voice_file.stat()
+            os.utime(voice_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert gen.preprocess_ref(str(voice_file), "ref") == ("audio", 24000, "ref")
+            assert utils_infer.preprocess_ref_audio_text.call_count == 2
+        assert len(gen._ref_cache) == 1
+
+    def test_inference_routed_to_daemon(self, tmp_path):
+        """Test that TTS_DAEMON_SOCK sends inference to the model daemon without loading the model."""
+        import threading
+        from src.tts_article import server
+
+        class FakeGenerator:
+            def infer_batch(self, ref_audio, ref_text, gen_texts, speeds, **kwargs):
+                return [(len(text), 24000) for text in gen_texts]
+
+            def preprocess_ref(self, ref_file, ref_text=""):
+                raise FileNotFoundError(ref_file)
+
+            def infer_with_cached_ref(self, ref_file, ref_text, gen_text, **kwargs):
+                return ref_file, 24000
+
+            def generate(self, segment, voice_config, output_path):
+                return voice_config.ref_audio, output_path
+
+        address = str(tmp_path / "d.sock")
+        thread = threading.Thread(target=server.serve, args=(FakeGenerator(), address), daemon=True)
+        thread.start()
+        for _ in range(100):
+            if server.is_running(address):
+                break
+            threading.Event().wait(0.01)
+
+        config = Config(input_article="test.txt", output_dir=str(tmp_path))
+        with patch.dict(os.environ, {server.DAEMON_SOCK_ENV: address}):
+            gen = AudioGenerator(config)
+        with patch.object(AudioGenerator, "initialize_model") as mock_init:
+            assert gen.ready
+            assert gen.infer_batch("v.wav", "ref", ["One.", "Three."], speeds=[1.0, 1.0]) == [(4, 24000), (6, 24000)]
+            with pytest.raises(FileNotFoundError):
+                gen.preprocess_ref("missing.wav")
+            # Relative paths are resolved here, not against the daemon's working directory
+            assert gen.infer_with_cached_ref("v.wav", "ref", "Hi.") == (os.path.abspath("v.wav"), 24000)
+            voice = VoiceConfig(name="main", ref_audio="v.wav")
+            segment = SentenceSegment(index=0, text="Hi.", voice_name="main")
+            assert gen.generate(segment, voice, output_path="out.wav") == (
+                os.path.abspath("v.wav"),
+                os.path.abspath("out.wav"),
+            )
+        mock_init.assert_not_called()
+
+        # A client without the daemon's key is turned away before anything is unpickled
+        from multiprocessing import AuthenticationError
+        from multiprocessing.connection import Client
+
+        with pytest.raises(AuthenticationError):
+            Client(address, family="AF_UNIX", authkey=b"wrong key")
+        assert server.is_running(address)
+
+        server.call(address, "shutdown")
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    def test_daemon_refuses_foreign_socket_dir(self, tmp_path):
+        """Test that a pre-created, non-private socket directory is not trusted."""
+        from src.tts_article import server
+
+        sock_dir = tmp_path / f"tts_article-{os.getuid()}"
+        sock_dir.mkdir(mode=0o777)
+        os.chmod(sock_dir, 0o777)
+        with patch("tempfile.gettempdir", return_value=str(tmp_path)):
+            with pytest.raises(RuntimeError, match="Refusing"):
+                server.default_address()
+            os.chmod(sock_dir, 0o700)
+            assert server.default_address() == str(sock_dir / "daemon.sock")
+
     def test_generate_missing_ref_audio_raises(self, tmp_path):
         """Test that missing reference audio raises FileNotFoundError."""
         config = Config(
@@ -481,10 +763,11 @@ class TestAudioGenerator:
     def test_get_audio_duration(self, tmp_path):
         """Test getting audio duration."""
         # Create a simple WAV file for testing
-        from pydub.generators import Sine
+        import numpy as np
+        import soundfile as sf
         audio_path = tmp_path / "test.wav"
-        tone = Sine(440).to_audio_segment(duration=1000)  # 1 second
-        tone.export(str(audio_path), format="wav")
+        tone = np.sin(2 * np.pi * 440 * np.arange(24000) / 24000).astype(np.float32)  # 1 second
+        sf.write(str(audio_path), tone, 24000)
 
         config = Config(
             input_article="test.txt",
@@ -496,6 +779,28 @@ class TestAudioGenerator:
         duration = gen.get_audio_duration(str(audio_path))
         assert 0.9 < duration < 1.1  # Approximately 1 second
 
+    def test_wav_duration_matches_soundfile(self, tmp_path):
+        """Test the WAV header fast path agrees with soundfile, and other formats fall back to it."""
+        import numpy as np
+        import soundfile as sf
+        from src.tts_article.utils import wav_duration
+
+        data = np.zeros((12345, 2), dtype=np.float32)
+        for name, subtype in [("pcm.wav", "PCM_16"), ("float.wav", "FLOAT"), ("pcm24.wav", "PCM_24"), ("a.flac", None)]:
+            path = str(tmp_path / name)
+            sf.write(path, data, 22050, subtype=subtype)
+            assert wav_duration(path) == pytest.approx(sf.info(path).duration)
+
+    def test_invalid_hash_seed_fixed_without_reexec(self):
+        """Test that an invalid PYTHONHASHSEED is rewritten in place instead of re-executing the CLI."""
+        from src.tts_article.generator import _ensure_safe_env
+
+        with patch.dict(os.environ, {"PYTHONHASHSEED": "not-a-seed"}), \
+             patch("os.execv") as mock_execv, patch("multiprocessing.set_start_method"):
+            _ensure_safe_env()
+            assert os.environ["PYTHONHASHSEED"] == "random"
+        mock_execv.assert_not_called()
+
 
 # ============================================================
 # Integration tests